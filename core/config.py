@@ -0,0 +1,51 @@
+"""
+Configuration Module.
+
+Reads the signal pipeline settings from the environment once into an
+immutable object, so the batcher hot path uses slot attribute access
+instead of module globals or repeated os.getenv() calls.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Signal pipeline settings.
+
+    Attributes:
+        batch_delay: Seconds of quiet before a message batch is flushed.
+        max_batch_size: Pending messages that trigger an early flush.
+        max_batch: Hard cap on pending messages (oldest dropped beyond it).
+        broker_max_workers: Threads (and concurrent calls) for broker requests.
+        signals_jsonl: Path of the append-only signal log.
+        signals_json: Path of the periodic signal snapshot.
+
+    Example:
+        >>> cfg = Config.from_env()
+        >>> cfg.batch_delay
+        1.5
+    """
+
+    batch_delay: float = 1.5
+    max_batch_size: int = 50
+    max_batch: int = 5000
+    broker_max_workers: int = 4
+    signals_jsonl: str = 'data/signals.jsonl'
+    signals_json: str = 'data/signals.json'
+
+    @classmethod
+    def from_env(cls) -> Config:
+        """Build a Config from environment variables, falling back to defaults."""
+        return cls(
+            batch_delay=float(os.getenv('BATCH_DELAY_SECONDS', '1.5')),
+            max_batch_size=int(os.getenv('MAX_BATCH_SIZE', '50')),
+            max_batch=int(os.getenv('MAX_BATCH', '5000')),
+            broker_max_workers=int(os.getenv('BROKER_MAX_WORKERS', '4')),
+            signals_jsonl=os.getenv('SIGNALS_JSONL', 'data/signals.jsonl'),
+            signals_json=os.getenv('SIGNALS_JSON', 'data/signals.json'),
+        )
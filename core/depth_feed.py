@@ -17,6 +17,7 @@ import asyncio
 import json
 import logging
 import struct
+import time
 from typing import Callable, Dict, List, Optional, Protocol, runtime_checkable
 
 import websockets
@@ -41,11 +42,25 @@ HEADER_FMT = '<HBBII'  # msg_len, feed_code, exch_seg, sec_id, reserved
 HEADER_SIZE = struct.calcsize(HEADER_FMT)
 DEPTH_LEVEL_SIZE = 16  # <dII (price, qty, orders)
 
+# Full tracebacks are logged at most once per exception type per interval
+TRACEBACK_INTERVAL = 60.0
+_traceback_ts: Dict[type, float] = {}
+
 # Type aliases
 DepthCallback = Callable[[Dict[str, object]], None]
 DepthLevel = Dict[str, float | int]
 
 
+def _log_exception(message: str, exc: BaseException) -> None:
+    """Log an error, attaching the traceback only if this type wasn't traced recently."""
+    now = time.monotonic()
+    exc_type = type(exc)
+    with_trace = now - _traceback_ts.get(exc_type, float('-inf')) >= TRACEBACK_INTERVAL
+    if with_trace:
+        _traceback_ts[exc_type] = now
+    logger.error(f'{message}: {exc}', exc_info=exc if with_trace else None)
+
+
 @runtime_checkable
 class WSConnection(Protocol):
     """Protocol for WebSocket connection interface."""
@@ -131,7 +146,7 @@ class DepthFeed:
                         if isinstance(message, (bytes, bytearray)):
                             self._parse_binary(message)
                         elif isinstance(message, str):
-                            logger.debug(f'Text frame: {message}')
+                            logger.debug('Text frame: %s', message)
 
             except ConnectionClosed as e:
                 if self._stop:
@@ -142,7 +157,7 @@ class DepthFeed:
             except (OSError, asyncio.TimeoutError) as e:
                 if self._stop:
                     break
-                logger.error(f'Feed error: {e}', exc_info=True)
+                _log_exception('Feed error', e)
                 await asyncio.sleep(2)
 
             finally:
@@ -280,7 +295,7 @@ class DepthFeed:
                 logger.error(f'Binary unpack error: {e}')
                 break
             except Exception as e:
-                logger.error(f'Parse error: {e}', exc_info=True)
+                _log_exception('Parse error', e)
                 break
 
     def _invoke_callbacks(self, data: Dict[str, object]) -> None:
@@ -289,7 +304,7 @@ class DepthFeed:
             try:
                 callback(data)
             except Exception as e:
-                logger.error(f'Callback error: {e}', exc_info=True)
+                _log_exception('Callback error', e)
 
     @staticmethod
     def _parse_depth_levels(payload: bytes) -> List[DepthLevel]:
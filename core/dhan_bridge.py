@@ -23,7 +23,7 @@ import threading
 import time
 from datetime import datetime, timedelta
 from threading import Lock
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import requests
@@ -68,6 +68,10 @@ class DhanBridge:
     FUNDS_CACHE_TTL = 18000  # seconds
     ATR_INTERVAL_INTRA = 5  # minutes
     ATR_INTERVAL_POS = 15  # minutes
+    # Shared ticker-API poll for securities without live depth; no faster than
+    # the 5s per-monitor poll it replaced
+    API_POLL_SECONDS = 5.0
+    API_POLL_MAX_SECONDS = 20.0  # backoff cap for quiet securities whose LTP isn't moving
 
     def __init__(self) -> None:
         """Initialize the Dhan bridge with API credentials and data feed."""
@@ -84,6 +88,7 @@ class DhanBridge:
         self._pending_orders: set[str] = set()
         self._pending_lock = Lock()
         self._imbalance_log_ts: Dict[str, float] = {}
+        self._api_price_log_ts: Dict[str, float] = {}
 
         # HTTP session
         self.session = requests.Session()
@@ -94,11 +99,18 @@ class DhanBridge:
 
         # Depth feed
         self.depth_cache: Dict[str, Dict[str, Any]] = {}
-        self.depth_updated = asyncio.Event()
+        self._tick_listeners: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        self._tick_lock = Lock()
+        # Securities priced via the shared API poller (sid -> watcher count)
+        self._api_watch: Dict[str, int] = {}
+        self._api_poller: Optional[asyncio.Task] = None
+        # sid -> current poll interval, doubled while the API keeps returning the same LTP
+        self._api_backoff: Dict[str, float] = {}
+        # Executor for the poller's REST calls; watchers pass in the broker pool
+        self._api_run_broker: Callable[..., Awaitable[Any]] = asyncio.to_thread
         self.feed: Optional[DepthFeed] = None
         self.feed_loop = asyncio.new_event_loop()
-        self.feed_thread = threading.Thread(
-            target=self._run_feed_loop, daemon=True)
+        self.feed_thread = threading.Thread(target=self._run_feed_loop, daemon=True)
 
         self._initialize_session()
 
@@ -156,8 +168,7 @@ class DhanBridge:
         logger.info(f'Subscribing to {len(symbols)} symbols...')
 
         if self.feed_loop.is_running():
-            asyncio.run_coroutine_threadsafe(
-                self.feed.subscribe(symbols), self.feed_loop)
+            asyncio.run_coroutine_threadsafe(self.feed.subscribe(symbols), self.feed_loop)
         else:
             logger.error('Feed loop not running')
 
@@ -172,8 +183,7 @@ class DhanBridge:
             return
 
         payload = [{'ExchangeSegment': 'NSE_FNO', 'SecurityId': sid}]
-        asyncio.run_coroutine_threadsafe(
-            self.feed.unsubscribe(payload), self.feed_loop)
+        asyncio.run_coroutine_threadsafe(self.feed.unsubscribe(payload), self.feed_loop)
         self.depth_cache.pop(sid, None)
 
     # =========================================================================
@@ -197,6 +207,7 @@ class DhanBridge:
                     'bid': [],
                     'ask': [],
                     'ltp': 0.0,
+                    'ltp_ts': 0.0,
                     'bid_ts': now,
                     'ask_ts': now,
                 }
@@ -208,14 +219,135 @@ class DhanBridge:
             bids = self.depth_cache[sid]['bid']
             asks = self.depth_cache[sid]['ask']
             if bids and asks:
-                self.depth_cache[sid]['ltp'] = (
-                    bids[0]['price'] + asks[0]['price']) / 2
+                self.depth_cache[sid]['ltp'] = (bids[0]['price'] + asks[0]['price']) / 2
+                self.depth_cache[sid]['ltp_ts'] = now
 
-            # Signal that depth has been updated (for event-driven monitors)
-            self.depth_updated.set()
+            self._notify_tick(sid)
 
         except Exception as e:
-            logger.error(f'Depth update error: {e}', exc_info=True)
+            # Runs per tick: keep the traceback out of the error line unless debugging
+            logger.error('Depth update error: %r', e)
+            logger.debug('Depth update traceback', exc_info=True)
+
+    def add_tick_listener(
+        self, security_id: str, event: Optional[asyncio.Event] = None
+    ) -> asyncio.Event:
+        """
+        Register for depth updates on a single security.
+
+        Must be called from a running event loop. The returned event is set
+        on that loop each time the feed delivers depth for the security.
+
+        Args:
+            security_id: The security to listen to.
+            event: Existing event to reuse (to wait on several securities).
+
+        Returns:
+            Event to wait on (clear it after each wakeup).
+        """
+        event = event or asyncio.Event()
+        entry = (asyncio.get_running_loop(), event)
+        with self._tick_lock:
+            # Copy-on-write so the feed thread can iterate without locking
+            self._tick_listeners[security_id] = [*self._tick_listeners.get(security_id, []), entry]
+        return event
+
+    def remove_tick_listener(self, security_id: str, event: asyncio.Event) -> None:
+        """
+        Unregister an event returned by add_tick_listener().
+
+        Args:
+            security_id: The security the event was registered for.
+            event: The event to remove.
+        """
+        with self._tick_lock:
+            remaining = [
+                entry
+                for entry in self._tick_listeners.get(security_id, [])
+                if entry[1] is not event
+            ]
+            if remaining:
+                self._tick_listeners[security_id] = remaining
+            else:
+                self._tick_listeners.pop(security_id, None)
+
+    def _notify_tick(self, security_id: str) -> None:
+        """Wake listeners of a security on their own loops (safe from any thread)."""
+        for loop, event in self._tick_listeners.get(security_id, ()):
+            loop.call_soon_threadsafe(event.set)
+
+    # =========================================================================
+    # Shared API Price Poller
+    # =========================================================================
+
+    def watch_api_price(
+        self, security_id: str, run_broker: Optional[Callable[..., Awaitable[Any]]] = None
+    ) -> None:
+        """
+        Keep a security's LTP fresh via the ticker API while it lacks live depth.
+
+        One shared task batches every watched security into a single request
+        each API_POLL_SECONDS and wakes their tick listeners, so monitors need
+        no polling timers of their own. Must be called from a running event loop.
+
+        Args:
+            security_id: The security to watch (pair with unwatch_api_price()).
+            run_broker: Executor for the poll requests, so they share the bounded
+                broker pool (defaults to asyncio.to_thread).
+        """
+        if run_broker is not None:
+            self._api_run_broker = run_broker
+        self._api_watch[security_id] = self._api_watch.get(security_id, 0) + 1
+        if self._api_poller is None or self._api_poller.done():
+            self._api_poller = asyncio.get_running_loop().create_task(self._api_price_loop())
+
+    def unwatch_api_price(self, security_id: str) -> None:
+        """
+        Release a watch taken with watch_api_price().
+
+        Args:
+            security_id: The security to stop watching.
+        """
+        count = self._api_watch.get(security_id, 0) - 1
+        if count > 0:
+            self._api_watch[security_id] = count
+        else:
+            self._api_watch.pop(security_id, None)
+            self._api_backoff.pop(security_id, None)
+
+    async def _api_price_loop(self) -> None:
+        """Poll the ticker API for watched securities with a stale LTP; exits when idle."""
+        while self._api_watch:
+            await asyncio.sleep(self.API_POLL_SECONDS)
+
+            # Skip anything updated recently by either source (depth feed or API);
+            # securities whose API price keeps coming back unchanged are polled less
+            now = time.monotonic()
+            stale = []
+            for sid in self._api_watch:
+                data = self.depth_cache.get(sid)
+                last = max(data['bid_ts'], data['ask_ts'], data.get('ltp_ts', 0.0)) if data else 0.0
+                if now - last >= self._api_backoff.get(sid, self.API_POLL_SECONDS):
+                    stale.append(sid)
+            if not stale:
+                continue
+
+            before = {sid: self.depth_cache.get(sid, {}).get('ltp', 0.0) for sid in stale}
+            try:
+                prices = await self._api_run_broker(self.fetch_ltps_from_api, stale)
+            except Exception as e:
+                logger.error('API price poll failed: %s', e)
+                continue
+
+            for sid in stale:
+                if prices.get(sid, before[sid]) != before[sid]:
+                    self._api_backoff.pop(sid, None)
+                else:
+                    interval = self._api_backoff.get(sid, self.API_POLL_SECONDS)
+                    self._api_backoff[sid] = min(interval * 2, self.API_POLL_MAX_SECONDS)
+
+            for sid in prices:
+                self._notify_tick(sid)
 
     def get_live_ltp(self, security_id: str) -> float:
         """
@@ -269,9 +401,10 @@ class DhanBridge:
             last = self._imbalance_log_ts.get(security_id, 0)
             if now - last >= 10:
                 logger.warning(
-                    f'⚠️ Empty Depth for {security_id}. \
-                    Bids: {len(bids or [])}, \
-                    Asks: {len(asks or [])}'
+                    '⚠️ Empty Depth for %s. Bids: %d, Asks: %d',
+                    security_id,
+                    len(bids or []),
+                    len(asks or []),
                 )
                 self._imbalance_log_ts[security_id] = now
             return 1.0
@@ -291,8 +424,7 @@ class DhanBridge:
             return 1.0
 
         # Anti-spoofing: discount orders that are >70% of total volume
-        buy_vol, sell_vol = self._apply_anti_spoofing(
-            bids, asks, buy_vol, sell_vol)
+        buy_vol, sell_vol = self._apply_anti_spoofing(bids, asks, buy_vol, sell_vol)
 
         if sell_vol <= 0:
             return 5.0
@@ -307,8 +439,7 @@ class DhanBridge:
         now = time.monotonic()
         last = self._imbalance_log_ts.get(security_id, 0)
         if now - last >= 10:
-            logger.warning(
-                f'⚠️ Stale data for {security_id}: lag {time_diff:.3f}s')
+            logger.warning('⚠️ Stale data for %s: lag %.3fs', security_id, time_diff)
             self._imbalance_log_ts[security_id] = now
 
     def _apply_anti_spoofing(
@@ -349,8 +480,12 @@ class DhanBridge:
         last = self._imbalance_log_ts.get(security_id, 0)
         if now - last >= 60:
             logger.info(
-                f'⚖️ IMB {security_id} = {imb} | '
-                f'Buy={buy_vol} Sell={sell_vol} | Lag={time_diff:.4f}s'
+                '⚖️ IMB %s = %s | Buy=%s Sell=%s | Lag=%.4fs',
+                security_id,
+                imb,
+                buy_vol,
+                sell_vol,
+                time_diff,
             )
             self._imbalance_log_ts[security_id] = now
 
@@ -432,14 +567,11 @@ class DhanBridge:
         """
         new_positions = []
         try:
-            resp = self.session.get(
-                f'{self.base_url}/positions', timeout=5).json()
-            positions = resp if isinstance(
-                resp, list) else resp.get('data', [])
+            resp = self.session.get(f'{self.base_url}/positions', timeout=5).json()
+            positions = resp if isinstance(resp, list) else resp.get('data', [])
 
             # Build map of live positions with non-zero quantity
-            live_map = {str(p['securityId']): p for p in positions if int(
-                p.get('netQty', 0)) != 0}
+            live_map = {str(p['securityId']): p for p in positions if int(p.get('netQty', 0)) != 0}
             live_sids = set(live_map.keys())
 
             # 1. Clean up stale trades
@@ -502,8 +634,7 @@ class DhanBridge:
             return cached
 
         try:
-            data = self.session.get(
-                f'{self.base_url}/fundlimit', timeout=5).json()
+            data = self.session.get(f'{self.base_url}/fundlimit', timeout=5).json()
             funds = float(data.get('sodLimit', 0.0))
             self._funds_cache = (funds, now)
             logger.info(f'Funds available: ₹{funds:,.0f}')
@@ -544,8 +675,7 @@ class DhanBridge:
                 'toDate': to_date.strftime('%Y-%m-%d'),
             }
 
-            resp = self.session.post(
-                f'{self.base_url}/charts/intraday', json=payload, timeout=10)
+            resp = self.session.post(f'{self.base_url}/charts/intraday', json=payload, timeout=10)
             data = resp.json()
 
             highs = np.array(data.get('high', []), dtype=float)
@@ -556,8 +686,7 @@ class DhanBridge:
                 logger.warning(f'ATR: Insufficient data for {symbol}')
                 return self._atr_fallback(symbol)
 
-            atr_series = talib.ATR(highs, lows, closes,
-                                   timeperiod=self.ATR_PERIOD)
+            atr_series = talib.ATR(highs, lows, closes, timeperiod=self.ATR_PERIOD)
             atr_series = atr_series[:-1]  # Drop forming candle
 
             if len(atr_series) == 0 or np.isnan(atr_series[-1]):
@@ -628,19 +757,17 @@ class DhanBridge:
 
             try:
                 data = resp.json()
-                status = data.get('orderStatus', '') if isinstance(
-                    data, dict) else ''
+                status = data.get('orderStatus', '') if isinstance(data, dict) else ''
             except Exception:
                 status = ''
 
             if resp.status_code == 202 or status in ('CANCELLED', 'CLOSED', 'TRADED'):
-                logger.info(f'{leg} cancelled for order {order_id}')
+                logger.info('%s cancelled for order %s', leg, order_id)
             else:
-                logger.debug(
-                    f'Cancel ignored: {leg} | HTTP {resp.status_code}')
+                logger.debug('Cancel ignored: %s | HTTP %s', leg, resp.status_code)
 
         except requests.RequestException as e:
-            logger.error(f'Cancel leg error [{order_id}/{leg}]: {e}')
+            logger.error('Cancel leg error [%s/%s]: %s', order_id, leg, e)
 
     def square_off_single(self, security_id: str) -> None:
         """
@@ -660,10 +787,8 @@ class DhanBridge:
         try:
             # Attempt market exit up to 5 times
             for _ in range(5):
-                resp = self.session.get(
-                    f'{self.base_url}/positions', timeout=5).json()
-                positions = resp if isinstance(
-                    resp, list) else resp.get('data', [])
+                resp = self.session.get(f'{self.base_url}/positions', timeout=5).json()
+                positions = resp if isinstance(resp, list) else resp.get('data', [])
 
                 for p in positions:
                     if str(p.get('securityId')) == sid:
@@ -683,8 +808,7 @@ class DhanBridge:
                             'validity': 'DAY',
                         }
 
-                        self.session.post(
-                            f'{self.base_url}/orders', json=payload, timeout=3)
+                        self.session.post(f'{self.base_url}/orders', json=payload, timeout=3)
                         logger.critical(f'MARKET EXIT: {sid}')
                         time.sleep(1)
                         break
@@ -739,47 +863,40 @@ class DhanBridge:
 
         # Then exit all positions
         try:
-            resp = self.session.get(
-                f'{self.base_url}/positions', timeout=5).json()
-            positions = resp if isinstance(
-                resp, list) else resp.get('data', [])
+            resp = self.session.get(f'{self.base_url}/positions', timeout=5).json()
+            positions = resp if isinstance(resp, list) else resp.get('data', [])
 
+            # Reuse this single positions snapshot for every exit
             for p in positions:
                 sid = str(p.get('securityId'))
-                self._square_off_position_market(sid)
+                self._square_off_position_market(p)
                 self.trade_manager.remove_trade(sid)
 
         except (requests.RequestException, ValueError) as e:
             logger.error(f'Square off all failed: {e}')
 
-    def _square_off_position_market(self, security_id: str) -> None:
-        """Execute market order to close a position."""
+    def _square_off_position_market(self, position: Dict[str, Any]) -> None:
+        """Execute market order to close a position (as returned by /positions)."""
+        security_id = str(position['securityId'])
         try:
-            resp = self.session.get(
-                f'{self.base_url}/positions', timeout=5).json()
-            positions = resp if isinstance(
-                resp, list) else resp.get('data', [])
+            qty = abs(int(position.get('netQty', 0)))
+            if qty == 0:
+                return
 
-            for p in positions:
-                if str(p['securityId']) == str(security_id):
-                    qty = abs(int(p.get('netQty', 0)))
-                    if qty == 0:
-                        return
-
-                    action = 'SELL' if int(p['netQty']) > 0 else 'BUY'
-                    payload = {
-                        'dhanClientId': self.client_id,
-                        'transactionType': action,
-                        'exchangeSegment': p['exchangeSegment'],
-                        'productType': p['productType'],
-                        'orderType': 'MARKET',
-                        'securityId': security_id,
-                        'quantity': qty,
-                        'validity': 'DAY',
-                    }
-
-                    self.session.post(f'{self.base_url}/orders', json=payload)
-                    logger.warning(f'🔫 Market exit: {security_id}')
+            action = 'SELL' if int(position['netQty']) > 0 else 'BUY'
+            payload = {
+                'dhanClientId': self.client_id,
+                'transactionType': action,
+                'exchangeSegment': position['exchangeSegment'],
+                'productType': position['productType'],
+                'orderType': 'MARKET',
+                'securityId': security_id,
+                'quantity': qty,
+                'validity': 'DAY',
+            }
+
+            self.session.post(f'{self.base_url}/orders', json=payload)
+            logger.warning(f'🔫 Market exit: {security_id}')
 
         except requests.RequestException as e:
             logger.error(f'Market square off error: {e}')
@@ -817,7 +934,7 @@ class DhanBridge:
             return 0.0, 'ERROR'
 
         sym = signal.get('trading_symbol', '')
-        logger.info(f'Processing: {sym}')
+        logger.info('Processing: %s', sym)
 
         # Extract signal parameters
         entry = float(signal.get('trigger_above') or 0.0)
@@ -826,10 +943,9 @@ class DhanBridge:
         is_positional = signal.get('is_positional', False)
 
         # Map symbol to security ID
-        sec_id, exch, lot, _ = self.mapper.get_security_id(
-            sym, entry, self.get_live_ltp)
+        sec_id, exch, lot, _ = self.mapper.get_security_id(sym, entry, self.get_live_ltp)
         if not sec_id:
-            logger.error(f'Security ID not found: {sym}')
+            logger.error('Security ID not found: %s', sym)
             return 0.0, 'ERROR'
 
         sid_str = str(sec_id)
@@ -839,7 +955,7 @@ class DhanBridge:
 
         # Check for duplicate
         if self.trade_manager.get_trade(sid_str):
-            logger.info(f'Duplicate signal ignored: {sym}')
+            logger.info('Duplicate signal ignored: %s', sym)
             return 0.0, 'ALREADY_OPEN'
 
         # Acquire pending lock
@@ -850,8 +966,7 @@ class DhanBridge:
 
         try:
             # Get current price
-            curr_ltp = self._get_current_price(
-                sid_str, exch_seg, entry, has_depth)
+            curr_ltp = self._get_current_price(sid_str, exch_seg, entry, has_depth)
             if curr_ltp == 0:
                 return 0.0, 'ERROR'
 
@@ -859,8 +974,7 @@ class DhanBridge:
             anchor = entry if entry > 0 else curr_ltp
             atr = self.fetch_atr(sid_str, exch_seg, sym, is_positional)
 
-            price_status = self._check_price_conditions(
-                curr_ltp, entry, atr, anchor)
+            price_status = self._check_price_conditions(curr_ltp, entry, atr, anchor)
             if price_status:
                 return curr_ltp, price_status
 
@@ -877,12 +991,13 @@ class DhanBridge:
                 sid_str, exch_seg, prod_type, qty, final_sl, final_target, trailing_jump
             )
 
-            logger.info(f'EXECUTING: {sym} | LTP: {curr_ltp} | Qty: {qty}')
+            logger.info('EXECUTING: %s | LTP: %s | Qty: %s', sym, curr_ltp, qty)
 
             return self._send_super_order(payload, signal, sid_str, sym)
 
         except requests.RequestException as e:
-            logger.error(f'Execution error: {e}', exc_info=True)
+            logger.error('Execution error: %r', e)
+            logger.debug('Execution traceback', exc_info=True)
             return 0.0, 'ERROR'
 
         finally:
@@ -909,66 +1024,95 @@ class DhanBridge:
 
             # 2. Try WebSocket (Fastest - if available)
             if has_depth:
-                self.subscribe(
-                    [{'ExchangeSegment': 'NSE_FNO', 'SecurityId': sid}])
+                self.subscribe([{'ExchangeSegment': 'NSE_FNO', 'SecurityId': sid}])
                 for _ in range(10):
                     time.sleep(0.05)
-                    curr_ltp = float(self.depth_cache.get(
-                        sid, {}).get('ltp', 0.0))
+                    curr_ltp = float(self.depth_cache.get(sid, {}).get('ltp', 0.0))
                     if curr_ltp > 0:
                         break
 
             # 3. API Fallback with 10-tick Polling (Strict Requirement)
             if curr_ltp == 0:
-                logger.info(
-                    f'Switching to API Polling (10 ticks) for {sid}...')
+                logger.info('Switching to API Polling (10 ticks) for %s...', sid)
                 for i in range(10):
                     # This fetches AND updates the cache
                     ltp = self._fetch_ltp_from_api(sid, exch_seg)
                     if ltp > 0:
                         curr_ltp = ltp
-                        logger.info(f'Tick {i + 1}/10: LTP {curr_ltp}')
+                        logger.info('Tick %d/10: LTP %s', i + 1, curr_ltp)
                     else:
-                        logger.warning(f'Tick {i + 1}/10: LTP 0')
+                        logger.warning('Tick %d/10: LTP 0', i + 1)
 
                     time.sleep(1)
 
         # Use signal entry as last resort
         if curr_ltp == 0 and entry > 0:
-            logger.warning(f'Using signal entry as anchor: {entry}')
+            logger.warning('Using signal entry as anchor: %s', entry)
             curr_ltp = entry
 
         return curr_ltp
 
     def _fetch_ltp_from_api(self, sid: str, exch_seg: str = '') -> float:
         """Fetch LTP via Dhan ticker API."""
-        try:
-            if not exch_seg:
-                exch_seg = self.mapper.get_exchange_segment(sid) or 'NSE_FNO'
+        segment = exch_seg or self.mapper.get_exchange_segment(sid) or 'NSE_FNO'
+        return self._fetch_segment_ltps({segment: [sid]}).get(sid, 0.0)
+
+    def fetch_ltps_from_api(self, security_ids: List[str]) -> Dict[str, float]:
+        """
+        Fetch LTPs for several securities with one ticker API call.
+
+        Args:
+            security_ids: Securities to price (any mix of exchange segments).
 
+        Returns:
+            Dict of security ID to LTP for every security with a price.
+        """
+        by_segment: Dict[str, List[str]] = {}
+        for sid in security_ids:
+            segment = self.mapper.get_exchange_segment(sid) or 'NSE_FNO'
+            by_segment.setdefault(segment, []).append(sid)
+        return self._fetch_segment_ltps(by_segment)
+
+    def _fetch_segment_ltps(self, by_segment: Dict[str, List[str]]) -> Dict[str, float]:
+        """POST /marketfeed/ltp for securities grouped by segment and cache the prices."""
+        prices: Dict[str, float] = {}
+        try:
             url = f'{self.base_url}/marketfeed/ltp'
-            payload = {exch_seg: [int(sid)]}
+            payload = {seg: [int(sid) for sid in sids] for seg, sids in by_segment.items()}
             resp = self.session.post(url, json=payload, timeout=2).json()
 
-            if resp.get('status') == 'success' and 'data' in resp:
-                item = resp['data'].get(exch_seg, {}).get(sid, {})
-                ltp = float(item.get('last_price', 0))
-                if ltp > 0:
+            if resp.get('status') != 'success' or 'data' not in resp:
+                return prices
+
+            now = time.monotonic()
+            for seg, sids in by_segment.items():
+                seg_data = resp['data'].get(seg, {})
+                for sid in sids:
+                    ltp = float(seg_data.get(sid, {}).get('last_price', 0))
+                    if ltp <= 0:
+                        continue
+
                     # Cache the value
                     if sid not in self.depth_cache:
                         self.depth_cache[sid] = {
                             'bid': [],
                             'ask': [],
                             'ltp': 0.0,
+                            'ltp_ts': 0.0,
                             'bid_ts': 0,
                             'ask_ts': 0,
                         }
                     self.depth_cache[sid]['ltp'] = ltp
-                    logger.info(f'API price: {ltp}')
-                return ltp
+                    self.depth_cache[sid]['ltp_ts'] = time.monotonic()
+                    prices[sid] = ltp
+
+                    # Polled every few seconds by monitors: log at most every 30s per SID
+                    if now - self._api_price_log_ts.get(sid, 0) >= 30:
+                        logger.info('API price: %s %s', sid, ltp)
+                        self._api_price_log_ts[sid] = now
         except Exception as e:
-            logger.error(f'API fetch failed: {e}')
-        return 0.0
+            logger.error('API fetch failed: %s', e)
+        return prices
 
     def _check_price_conditions(
         self, curr_ltp: float, entry: float, atr: float, anchor: float
@@ -977,15 +1121,14 @@ class DhanBridge:
         if not entry:
             return None
 
-        entry_limit = anchor + \
-            min(atr * 1.5, anchor * 0.15) if atr > 0 else anchor * 1.10
+        entry_limit = anchor + min(atr * 1.5, anchor * 0.15) if atr > 0 else anchor * 1.10
 
         if curr_ltp > entry_limit:
-            logger.warning(f'Price too high: {curr_ltp} > {entry_limit:.2f}')
+            logger.warning('Price too high: %s > %.2f', curr_ltp, entry_limit)
             return 'PRICE_HIGH'
 
         if curr_ltp < entry:
-            logger.info(f'Price below trigger: {curr_ltp} < {entry}')
+            logger.info('Price below trigger: %s < %s', curr_ltp, entry)
             return 'PRICE_LOW'
 
         return None
@@ -1059,8 +1202,7 @@ class DhanBridge:
         self, payload: Dict[str, Any], signal: Dict[str, Any], sid: str, sym: str
     ) -> Tuple[float, str]:
         """Send super order to Dhan API."""
-        resp = self.session.post(
-            f'{self.base_url}/super/orders', json=payload, timeout=5)
+        resp = self.session.post(f'{self.base_url}/super/orders', json=payload, timeout=5)
 
         if resp.status_code not in (200, 201):
             logger.error(f'API error: {resp.text}')
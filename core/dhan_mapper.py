@@ -15,7 +15,7 @@ import logging
 import os
 import re
 from datetime import date, datetime
-from typing import Callable, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 import polars as pl
 import requests
@@ -59,16 +59,44 @@ class DhanMapper:
     COL_OPTION_TYPE = 'SEM_OPTION_TYPE'
     COL_TICK_SIZE = 'SEM_TICK_SIZE'
 
+    # Exchange ID (as found in the master CSV) -> feed/order segment
+    _EXCHANGE_SEGMENTS = {
+        'NSE': 'NSE_FNO',
+        'NFO': 'NSE_FNO',
+        'BSE': 'BSE_FNO',
+        'BFO': 'BSE_FNO',
+        'NSE_EQ': 'NSE_EQ',
+        'BSE_EQ': 'BSE_EQ',
+    }
+
     # Month abbreviations for symbol parsing
     _MONTHS = frozenset(
         {'JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'}
     )
+    _MONTH_NUMBERS = {
+        'JAN': 1,
+        'FEB': 2,
+        'MAR': 3,
+        'APR': 4,
+        'MAY': 5,
+        'JUN': 6,
+        'JUL': 7,
+        'AUG': 8,
+        'SEP': 9,
+        'OCT': 10,
+        'NOV': 11,
+        'DEC': 12,
+    }
 
     def __init__(self) -> None:
         """Initialize the mapper and load the master CSV."""
         os.makedirs('cache', exist_ok=True)
         self._refresh_master_csv()
         self.df = self._load_csv()
+        # symbol -> mapping for the current day; only results that are the same
+        # whatever price_ref is (exact or single-candidate matches)
+        self._sid_cache: Dict[str, Tuple[SecurityId, ExchangeId, LotSize, TickSize]] = {}
+        self._sid_cache_day: Optional[date] = None
 
     def _refresh_master_csv(self) -> None:
         """
@@ -165,21 +193,10 @@ class DhanMapper:
                 return None
 
             exch_id = str(row.item()).strip().upper()
-
-            # Map exchange ID to segment
-            if exch_id in ('NSE', 'NFO'):
-                return 'NSE_FNO'
-            elif exch_id in ('BSE', 'BFO'):
-                return 'BSE_FNO'
-            elif exch_id == 'NSE_EQ':
-                return 'NSE_EQ'
-            elif exch_id == 'BSE_EQ':
-                return 'BSE_EQ'
-            else:
-                return None
+            return self._EXCHANGE_SEGMENTS.get(exch_id)
 
         except Exception as e:
-            logger.debug(f'Exchange segment lookup failed: {e}')
+            logger.debug('Exchange segment lookup failed: %s', e)
             return None
 
     def get_security_id(
@@ -213,12 +230,22 @@ class DhanMapper:
             return None, None, 0, 0.0
 
         today = get_today()
+        if today != self._sid_cache_day:
+            # Expiries roll over daily; drop yesterday's mappings
+            self._sid_cache.clear()
+            self._sid_cache_day = today
+
         symbol_upper = trading_symbol.upper().strip()
+        cached = self._sid_cache.get(symbol_upper)
+        if cached:
+            return cached
+
         logger.info(f"🔍 Mapping: '{symbol_upper}' | Ref Price: {price_ref}")
 
         # Step 1: Try exact match first (fastest path)
         exact_match = self._find_exact_match(symbol_upper, today)
         if exact_match:
+            self._sid_cache[symbol_upper] = exact_match
             return exact_match
 
         # Step 2: Parse symbol components and search
@@ -237,13 +264,20 @@ class DhanMapper:
         # Step 4: Select best candidate (by price or nearest expiry)
         best_row = self._select_best_candidate(candidates, price_ref, ltp_fetcher)
 
-        return (
+        result = (
             str(best_row[self.COL_SECURITY_ID]),
             str(best_row[self.COL_EXCHANGE_ID]),
             int(best_row[self.COL_LOT_UNITS] or 1),
             0.0,
         )
 
+        # With several expiries the pick depends on price_ref and live quotes,
+        # so only a lone candidate is safe to reuse for other lookups
+        if candidates.height == 1:
+            self._sid_cache[symbol_upper] = result
+
+        return result
+
     def _find_exact_match(
         self, symbol: str, today: date
     ) -> Optional[Tuple[SecurityId, ExchangeId, LotSize, TickSize]]:
@@ -317,22 +351,7 @@ class DhanMapper:
 
         if target_month:
             # Map month name (FEB) to month number, fallback to ignore if unknown
-            # Standard month map
-            m_map = {
-                'JAN': 1,
-                'FEB': 2,
-                'MAR': 3,
-                'APR': 4,
-                'MAY': 5,
-                'JUN': 6,
-                'JUL': 7,
-                'AUG': 8,
-                'SEP': 9,
-                'OCT': 10,
-                'NOV': 11,
-                'DEC': 12,
-            }
-            month_num = m_map.get(target_month)
+            month_num = self._MONTH_NUMBERS.get(target_month)
             if month_num:
                 candidates = candidates.filter(pl.col(self.COL_EXPIRY_DATE).dt.month() == month_num)
 
@@ -422,7 +441,8 @@ class DhanMapper:
         if self.df.is_empty():
             return None, 0.0
 
-        # Handle both space-separated ("NIFTY 24500 CE") and hyphenated ("SONACOMS-FEB2026-500-PE") formats
+        # Handle both space-separated ("NIFTY 24500 CE") and
+        # hyphenated ("SONACOMS-FEB2026-500-PE") formats
         if '-' in symbol:
             underlying = symbol.split('-')[0].upper()
         else:
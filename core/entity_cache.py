@@ -0,0 +1,126 @@
+"""
+Entity Cache Module.
+
+Persists resolved Telegram peers (ID + access hash + peer type) so that
+restarts can build input peers locally instead of asking Telegram to resolve
+every target channel again.
+
+Entries are stored in JSON format keyed by the configured target:
+    {"-1001234567890": {"id": 1234567890, "access_hash": 987654321, "type": "channel"}}
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import Any, Dict, Optional, Union
+
+from telethon.tl.types import Channel, Chat, InputPeerChannel, InputPeerChat, InputPeerUser, User
+
+logger = logging.getLogger('EntityCache')
+
+ENTITY_CACHE_FILE = 'data/entity_cache.json'
+
+InputPeer = Union[InputPeerChannel, InputPeerChat, InputPeerUser]
+
+
+class EntityCache:
+    """
+    Disk-backed map of configured targets to Telegram input peers.
+
+    Attributes:
+        file_path: Path to the cache JSON file.
+
+    Example:
+        >>> cache = EntityCache()
+        >>> peer = cache.get(-1001234567890)
+        >>> if peer is None:
+        ...     entity = await client.get_entity(-1001234567890)
+        ...     cache.put(-1001234567890, entity)
+        ...     cache.save()
+    """
+
+    def __init__(self, file_path: str = ENTITY_CACHE_FILE) -> None:
+        """
+        Initialize the cache and load existing entries.
+
+        Args:
+            file_path: Path to the cache JSON file.
+        """
+        self.file_path = file_path
+        self._dirty = False
+        self._entries: Dict[str, Dict[str, Any]] = self.load()
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Load cached entries from disk."""
+        try:
+            with open(self.file_path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
+
+    def save(self) -> None:
+        """Atomically save cached entries to disk (no-op if unchanged)."""
+        if not self._dirty:
+            return
+
+        os.makedirs(os.path.dirname(self.file_path) or '.', exist_ok=True)
+        tmp_path = f'{self.file_path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self._entries, f, indent=2)
+        os.replace(tmp_path, self.file_path)
+        self._dirty = False
+
+    def get(self, target: Any) -> Optional[InputPeer]:
+        """
+        Build an input peer for a cached target.
+
+        Args:
+            target: Configured channel ID or username.
+
+        Returns:
+            InputPeerChannel/User/Chat, or None on a cache miss.
+        """
+        entry = self._entries.get(str(target))
+        if not entry:
+            return None
+
+        # Entries written before peer types were stored are channels
+        peer_type = entry.get('type', 'channel')
+        if peer_type == 'chat':
+            return InputPeerChat(entry['id'])
+        if peer_type == 'user':
+            return InputPeerUser(entry['id'], entry['access_hash'])
+        return InputPeerChannel(entry['id'], entry['access_hash'])
+
+    def put(self, target: Any, entity: Any) -> bool:
+        """
+        Remember a resolved entity for a target.
+
+        Args:
+            target: Configured channel ID or username.
+            entity: Entity returned by Telethon's get_entity().
+
+        Returns:
+            True if the entry was stored.
+        """
+        if isinstance(entity, Chat):
+            entry = {'id': int(entity.id), 'access_hash': 0, 'type': 'chat'}
+        elif isinstance(entity, (Channel, User)) and entity.access_hash is not None:
+            peer_type = 'channel' if isinstance(entity, Channel) else 'user'
+            entry = {
+                'id': int(entity.id),
+                'access_hash': int(entity.access_hash),
+                'type': peer_type,
+            }
+        else:
+            return False
+
+        if self._entries.get(str(target)) == entry:
+            return False
+
+        self._entries[str(target)] = entry
+        self._dirty = True
+        logger.info(f'Cached entity for {target}: {entity.id}')
+        return True
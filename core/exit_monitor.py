@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Set
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Set
 
 if TYPE_CHECKING:
     from core.dhan_bridge import DhanBridge
@@ -42,14 +42,15 @@ class ExitMonitor:
         bridge: DhanBridge,
         notifier: Notifier,
         trade_manager: TradeManager,
-        active_monitors: Set[str],
         subscribed_sids: Set[str],
+        run_broker: Optional[Callable[..., Awaitable[Any]]] = None,
     ):
         self.bridge = bridge
         self.notifier = notifier
         self.tm = trade_manager
-        self.active_monitors = active_monitors
         self._subscribed_sids = subscribed_sids
+        # Executor for square-offs; should not share slots with entry orders
+        self._run_broker = run_broker or asyncio.to_thread
 
     async def run(self, sym: str, sid: str):
         """Main exit monitor loop for a single trade."""
@@ -76,32 +77,33 @@ class ExitMonitor:
 
         if trigger_price > 0 and entry_price > 0 and entry_price < trigger_price:
             logger.warning(
-                f'⚠️ WICK DETECTED: {sym} entry={entry_price:.2f} < trigger={trigger_price:.2f}'
+                '⚠️ WICK DETECTED: %s entry=%.2f < trigger=%.2f', sym, entry_price, trigger_price
             )
             await self.notifier.squared_off(
                 sym, f'Wick entry (avg {entry_price:.2f} < {trigger_price:.2f})'
             )
-            self.bridge.square_off_single(sid)
-            self.active_monitors.discard(sym)
+            await self._run_broker(self.bridge.square_off_single, sid)
             return
 
         # --- WICK DETECTION: First 10 seconds - ensure price sustains above trigger ---
         if trigger_price > 0:
-            logger.info(f'{sym}: Monitoring wick protection for 10s (trigger={trigger_price:.2f})')
+            logger.info('%s: Monitoring wick protection for 10s (trigger=%.2f)', sym, trigger_price)
             for _ in range(5):  # 5 checks × 2s = 10s
                 await asyncio.sleep(2)
                 ltp = self.bridge.get_live_ltp(sid)
                 if ltp > 0 and ltp < trigger_price * 0.995:  # Allow 0.5% tolerance
                     logger.warning(
-                        f'⚠️ WICK EXIT: {sym} price={ltp:.2f} fell below trigger={trigger_price:.2f}'
+                        '⚠️ WICK EXIT: %s price=%.2f fell below trigger=%.2f',
+                        sym,
+                        ltp,
+                        trigger_price,
                     )
                     await self.notifier.squared_off(
                         sym, f'Wick (price {ltp:.2f} < {trigger_price:.2f})'
                     )
-                    self.bridge.square_off_single(sid)
-                    self.active_monitors.discard(sym)
+                    await self._run_broker(self.bridge.square_off_single, sid)
                     return
-            logger.info(f'{sym}: Wick protection passed, continuing normal monitoring')
+            logger.info('%s: Wick protection passed, continuing normal monitoring', sym)
 
         liquidity_sids = self.bridge.get_liquidity_sids(sym, sid)
         new_subs = []
@@ -117,21 +119,26 @@ class ExitMonitor:
             self.bridge.subscribe(new_subs)
 
         logger.info(
-            f'🎯 Exit Monitor Started: {sym} ({direction}) | '
-            f'Thresholds: bad<{bad_imb}, good>={good_imb}'
+            '🎯 Exit Monitor Started: %s (%s) | Thresholds: bad<%s, good>=%s',
+            sym,
+            direction,
+            bad_imb,
+            good_imb,
         )
 
         last_log_time = 0
 
+        # One event shared by all liquidity SIDs: wake only on ticks that matter
+        tick = asyncio.Event()
+        for liq_sid in liquidity_sids:
+            self.bridge.add_tick_listener(liq_sid, tick)
+
         try:
             while True:
-                # Wait for depth update (event-driven) with timeout
+                # Wait for a depth tick on our liquidity SIDs, with timeout
                 try:
-                    await asyncio.wait_for(
-                        self.bridge.depth_updated.wait(),
-                        timeout=2.0,  # Fallback if no updates
-                    )
-                    self.bridge.depth_updated.clear()
+                    await asyncio.wait_for(tick.wait(), timeout=2.0)  # Fallback if no updates
+                    tick.clear()
                 except asyncio.TimeoutError:
                     pass  # Continue to check even if no update
 
@@ -153,22 +160,32 @@ class ExitMonitor:
                 if now - last_log_time >= 60:
                     last_log_time = now
                     logger.info(
-                        f'📊 IMB {sym} ({direction}): raw={raw_imb:.2f} eff={effective_imb:.2f} | '
-                        f'bad_ticks={bad_tick_count}/{bad_ticks_required}'
+                        '📊 IMB %s (%s): raw=%.2f eff=%.2f | bad_ticks=%d/%d',
+                        sym,
+                        direction,
+                        raw_imb,
+                        effective_imb,
+                        bad_tick_count,
+                        bad_ticks_required,
                     )
 
                 # Use effective_imb for threshold checks
                 if effective_imb >= good_imb:
                     if bad_tick_count > 0:
-                        logger.info(f'{sym} liquidity recovered ({effective_imb:.2f}), resetting')
+                        logger.info('%s liquidity recovered (%.2f), resetting', sym, effective_imb)
                     bad_tick_count = 0
                     continue
 
                 if effective_imb < bad_imb:
                     bad_tick_count += 1
                     logger.warning(
-                        f'{sym} ({direction}) bad imbalance eff={effective_imb:.2f} '
-                        f'raw={raw_imb:.2f} ({bad_tick_count}/{bad_ticks_required})'
+                        '%s (%s) bad imbalance eff=%.2f raw=%.2f (%d/%d)',
+                        sym,
+                        direction,
+                        effective_imb,
+                        raw_imb,
+                        bad_tick_count,
+                        bad_ticks_required,
                     )
                 else:
                     bad_tick_count = max(0, bad_tick_count - 1)
@@ -178,19 +195,22 @@ class ExitMonitor:
 
                     if trade.get('is_manual', False):
                         # Manual Trade: ALERT ONLY
-                        logger.critical(f'🚨 MANUAL TRADE ALERT: {sym} ({direction}) - {reason}')
+                        logger.critical(
+                            '🚨 MANUAL TRADE ALERT: %s (%s) - %s', sym, direction, reason
+                        )
                         # Reset counter to avoid spamming every update, or keep warning?
                         # Let's reset purely to allow "re-alerting" later if it persists
                         bad_tick_count = 0
                     else:
                         # Auto Trade: EXECUTE EXIT
                         await self.notifier.squared_off(sym, reason)
-                        logger.critical(f'⚠️ Exit Triggered: {sym} ({direction}) - {reason}')
-                        self.bridge.square_off_single(sid)
+                        logger.critical('⚠️ Exit Triggered: %s (%s) - %s', sym, direction, reason)
+                        await self._run_broker(self.bridge.square_off_single, sid)
                         break
 
         finally:
-            self.active_monitors.discard(sym)
+            for liq_sid in liquidity_sids:
+                self.bridge.remove_tick_listener(liq_sid, tick)
 
 
 class RetryMonitor:
@@ -198,10 +218,25 @@ class RetryMonitor:
     Monitors price and retries order execution when breakout trigger is hit.
     """
 
-    def __init__(self, bridge: DhanBridge, trade_manager: TradeManager, active_monitors: Set[str]):
+    # Depth-fed instruments wake the monitor on every tick; API-priced (BSE)
+    # instruments are woken by the bridge's shared poller. The tick timeout is
+    # only a safety net so kill-switch and deadline checks still run.
+    TICK_TIMEOUT = 10.0
+    MAX_WAIT_SECONDS = 1800 * 5  # 2.5 hours, as the original 1800 x 5s poll
+    CONFIRMS_REQUIRED = 3
+    # Same hold window as the old 5s poll: 3 confirmations >= 10s above trigger
+    CONFIRM_SPACING = 5.0  # min seconds between counted confirmations
+
+    def __init__(
+        self,
+        bridge: DhanBridge,
+        trade_manager: TradeManager,
+        run_broker: Optional[Callable[..., Awaitable[Any]]] = None,
+    ):
         self.bridge = bridge
         self.tm = trade_manager
-        self.active_monitors = active_monitors
+        # Executor for blocking broker calls (defaults to the asyncio thread pool)
+        self._run_broker = run_broker or asyncio.to_thread
 
     async def run(self, sig: Dict[str, Any], on_success_callback):
         """
@@ -214,9 +249,10 @@ class RetryMonitor:
         sym = str(sig.get('trading_symbol', ''))
         entry = float(sig.get('trigger_above', 0))
 
-        sid, _, _, _ = self.bridge.mapper.get_security_id(sym, entry, self.bridge.get_live_ltp)
+        sid, _, _, _ = await self._run_broker(
+            self.bridge.mapper.get_security_id, sym, entry, self.bridge.get_live_ltp
+        )
         if not sid:
-            self.active_monitors.discard(sym)
             return
 
         sid_str = str(sid)
@@ -224,30 +260,45 @@ class RetryMonitor:
         subs = [{'ExchangeSegment': 'NSE_FNO', 'SecurityId': s} for s in liquidity_sids]
         self.bridge.subscribe(subs)
 
+        loop = asyncio.get_running_loop()
+        tick = self.bridge.add_tick_listener(sid_str)
+        self.bridge.watch_api_price(sid_str, self._run_broker)
+        deadline = loop.time() + self.MAX_WAIT_SECONDS
+
         try:
             cnt = 0
-            for _ in range(1800):  # 5 hours max (1800 * 10s)
+            last_confirm = 0.0
+            while loop.time() < deadline:
                 if self.bridge.kill_switch_triggered:
                     return
 
-                await asyncio.sleep(5.0)
+                try:
+                    await asyncio.wait_for(tick.wait(), timeout=self.TICK_TIMEOUT)
+                    tick.clear()
+                except asyncio.TimeoutError:
+                    pass
 
-                ltp = self.bridge.get_live_ltp(sid_str)
+                # Depth ticks and the shared API poller both refresh the cache
+                ltp = float(self.bridge.depth_cache.get(sid_str, {}).get('ltp', 0.0))
                 if ltp == 0:
                     continue
 
                 if ltp >= entry:
-                    cnt += 1
+                    # Ticks can arrive in bursts; keep confirmations spaced out
+                    now = loop.time()
+                    if now - last_confirm >= self.CONFIRM_SPACING:
+                        cnt += 1
+                        last_confirm = now
                 else:
                     cnt = 0
 
-                if cnt >= 3:
-                    logger.info(f'⚡ Trigger Hit: {sym} ({ltp} >= {entry}). Executing!')
-                    _, status = await asyncio.to_thread(self.bridge.execute_super_order, sig)
+                if cnt >= self.CONFIRMS_REQUIRED:
+                    logger.info('⚡ Trigger Hit: %s (%s >= %s). Executing!', sym, ltp, entry)
+                    _, status = await self._run_broker(self.bridge.execute_super_order, sig)
 
                     if status == 'SUCCESS':
                         await on_success_callback(sym, sid_str)
                     return
         finally:
-            if not self.tm.get_trade(sid_str):
-                self.active_monitors.discard(sym)
+            self.bridge.unwatch_api_price(sid_str)
+            self.bridge.remove_tick_listener(sid_str, tick)
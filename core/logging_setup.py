@@ -0,0 +1,195 @@
+"""
+Logging Setup Module.
+
+Builds the bot's logging pipeline: callers only enqueue records, and a
+QueueListener thread writes them to a buffered, size-rotated trade log and,
+when attached to a terminal, to the console.
+
+Example:
+    >>> setup_logging(level='INFO')
+    >>> logging.getLogger('Main').info('Bot started')
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import os
+import queue
+import sys
+import time
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+from typing import List, Optional
+
+LOG_FILE = 'logs/trade.log'
+LOG_FORMAT = '%(asctime)s [%(levelname)s] [%(name)s] %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+LOG_BUFFER_CAPACITY = 512
+
+
+# =============================================================================
+# Handlers
+# =============================================================================
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that tracks the file size in memory and buffers writes.
+
+    The stock shouldRollover() formats the record a second time and seeks to
+    the end of the file on every emit. Here the byte count of each written
+    record is accumulated, and the exact check only runs near maxBytes.
+
+    The file is opened with a 64 KB buffer and the per-record flush done by
+    StreamHandler.emit() is skipped; callers push data out with sync().
+    """
+
+    ROLLOVER_MARGIN = 8192
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, filename: str, **kwargs):
+        super().__init__(filename, **kwargs)
+        self._size = os.path.getsize(filename) if os.path.exists(filename) else 0
+        self._last_len = 0
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def flush(self):
+        # Called by StreamHandler.emit() after every record; see sync()
+        pass
+
+    def sync(self):
+        """Write buffered records to the file."""
+        super().flush()
+
+    def format(self, record: logging.LogRecord) -> str:
+        msg = super().format(record)
+        self._last_len = len(msg.encode(self.encoding or 'utf-8')) + len(self.terminator)
+        return msg
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if not self.maxBytes or self._size < self.maxBytes - self.ROLLOVER_MARGIN:
+            return False
+        if super().shouldRollover(record):
+            return True
+        # Resync with the real size while we are close to the limit
+        if self.stream is not None:
+            self._size = self.stream.tell()
+        return False
+
+    def doRollover(self):
+        super().doRollover()
+        self._size = 0
+
+    def emit(self, record: logging.LogRecord):
+        super().emit(record)
+        self._size += self._last_len
+
+
+class TimedMemoryHandler(MemoryHandler):
+    """
+    MemoryHandler that also flushes once `interval` seconds pass since the last flush.
+
+    Each flush hands the batch to the target and then syncs it, so a buffered
+    target writes the whole batch at once.
+    """
+
+    def __init__(self, capacity: int, interval: float, **kwargs):
+        super().__init__(capacity, **kwargs)
+        self.interval = interval
+        self._last_flush = time.monotonic()
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return super().shouldFlush(record) or time.monotonic() - self._last_flush >= self.interval
+
+    def flush(self):
+        super().flush()
+        sync = getattr(self.target, 'sync', None)
+        if sync is not None:
+            sync()
+        self._last_flush = time.monotonic()
+
+
+# =============================================================================
+# Setup
+# =============================================================================
+
+# Buffer in front of the trade log once setup_logging() has run
+_file_buffer: Optional[TimedMemoryHandler] = None
+
+
+def setup_logging(
+    level: str = 'INFO',
+    log_file: str = LOG_FILE,
+    max_bytes: int = 50 * 1024 * 1024,
+    backup_count: int = 5,
+    flush_seconds: float = 1.0,
+) -> TimedMemoryHandler:
+    """
+    Configure root logging once (later calls return the existing setup).
+
+    Args:
+        level: Root log level name.
+        log_file: Path of the rotating trade log.
+        max_bytes: Size at which the trade log rotates.
+        backup_count: Rotated files to keep.
+        flush_seconds: Max age of buffered trade log records.
+
+    Returns:
+        The memory buffer in front of the trade log.
+    """
+    global _file_buffer
+    if _file_buffer is not None:
+        return _file_buffer
+
+    formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+
+    os.makedirs(os.path.dirname(log_file) or '.', exist_ok=True)
+    file_handler = FastRotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+    )
+    file_handler.setFormatter(formatter)
+
+    # Batch file writes; errors and the flush interval push the buffer out early
+    file_buffer = TimedMemoryHandler(
+        LOG_BUFFER_CAPACITY, flush_seconds, flushLevel=logging.ERROR, target=file_handler
+    )
+
+    handlers: List[logging.Handler] = [file_buffer]
+    # Under systemd/Docker stdout is a pipe that re-captures what the file already has
+    if sys.stdout.isatty():
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+
+    # File/console IO (including rotation) runs on the listener thread;
+    # logging calls on the event loop only enqueue the record.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Replace (not add to) whatever handlers are already on the root logger
+    root = logging.getLogger()
+    root.handlers.clear()
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
+    root.addHandler(QueueHandler(log_queue))
+
+    _file_buffer = file_buffer
+    return file_buffer
+
+
+async def log_flush_loop(interval: float = 1.0):
+    """Flush buffered log records that would otherwise wait for the next record."""
+    while True:
+        await asyncio.sleep(interval)
+        if _file_buffer is not None and _file_buffer.buffer:
+            await asyncio.to_thread(_file_buffer.flush)
@@ -2,13 +2,17 @@
 Notifier Module.
 
 Sends trading notifications to admin via Telegram. Used for order
-confirmations, error alerts, and kill switch notifications.
+confirmations, error alerts, and kill switch notifications. Bursts of
+notifications are coalesced into a single Telegram message.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import deque
 from datetime import datetime
+from typing import Deque, Iterator, List, Optional
 
 from telethon import TelegramClient
 
@@ -28,6 +32,10 @@ class Notifier:
         >>> await notifier.order_placed("NIFTY 24500 CE", 100, 125.50)
     """
 
+    COALESCE_SECONDS = 0.2  # window for merging bursts into one message
+    MAX_MESSAGE_LEN = 4096  # Telegram text limit
+    SEPARATOR = '\n---\n'
+
     def __init__(self, client: TelegramClient, chat_id: int) -> None:
         """
         Initialize the notifier.
@@ -38,16 +46,56 @@ class Notifier:
         """
         self.client = client
         self.chat_id = chat_id
+        self._pending: Deque[str] = deque()
+        self._sender: Optional[asyncio.Task] = None
 
     async def send(self, message: str) -> None:
         """
-        Send a message to the admin chat.
+        Queue a message for the admin chat.
+
+        Returns immediately; messages queued within COALESCE_SECONDS of each
+        other are delivered together as one Telegram message.
 
         Args:
             message: Text message to send.
         """
+        self._pending.append(message)
+        if self._sender is None or self._sender.done():
+            self._sender = asyncio.get_running_loop().create_task(self._send_loop())
+
+    async def flush(self) -> None:
+        """Wait until all queued messages have been delivered."""
+        if self._sender is not None and not self._sender.done():
+            await self._sender
+
+    async def _send_loop(self) -> None:
+        """Drain the queue in coalesced batches until it stays empty."""
+        while self._pending:
+            await asyncio.sleep(self.COALESCE_SECONDS)
+            batch = list(self._pending)
+            self._pending.clear()
+            for text in self._pack(batch):
+                await self._deliver(text)
+
+    def _pack(self, messages: List[str]) -> Iterator[str]:
+        """Join messages into as few texts as fit Telegram's length limit."""
+        chunk: List[str] = []
+        size = 0
+        for msg in messages:
+            added = len(msg) + (len(self.SEPARATOR) if chunk else 0)
+            if chunk and size + added > self.MAX_MESSAGE_LEN:
+                yield self.SEPARATOR.join(chunk)
+                chunk, size = [], 0
+                added = len(msg)
+            chunk.append(msg)
+            size += added
+        if chunk:
+            yield self.SEPARATOR.join(chunk)
+
+    async def _deliver(self, text: str) -> None:
+        """Send one message to the admin chat, logging (not raising) failures."""
         try:
-            await self.client.send_message(self.chat_id, message)
+            await self.client.send_message(self.chat_id, text)
         except (ValueError, IOError) as e:
             logger.error(f'Telegram notify failed: {e}')
         except Exception as e:
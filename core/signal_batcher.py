@@ -9,39 +9,43 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Coroutine, Deque, Dict, Optional, Set, Tuple
 
+from core.config import Config
 from core.dhan_bridge import DhanBridge
 from core.exit_monitor import ExitMonitor, RetryMonitor
 from core.notifier import Notifier
-from core.signal_parser import process_and_save
+from core.signal_parser import flush_signals_snapshot, now_ist, process_and_save
 
 logger = logging.getLogger('SignalBatcher')
 
-SIGNALS_JSONL = os.getenv('SIGNALS_JSONL', 'data/signals.jsonl')
-SIGNALS_JSON = os.getenv('SIGNALS_JSON', 'data/signals.json')
-BATCH_DELAY_SECONDS = 1.5
-
 
 class ChannelState:
     """Tracks paused channels (pause until end of day)."""
 
     def __init__(self):
-        self._paused_until: Dict[int, datetime] = {}
+        # Monotonic deadlines keep is_paused() free of datetime construction
+        self._paused_until: Dict[int, float] = {}
 
     def pause(self, channel_id: int):
-        self._paused_until[channel_id] = datetime.now().replace(hour=23, minute=59, second=59)
+        # End of the trading day in IST, whatever the host timezone is
+        now = now_ist()
+        end_of_day = now.replace(hour=23, minute=59, second=59)
+        self._paused_until[channel_id] = time.monotonic() + (end_of_day - now).total_seconds()
 
     def resume(self, channel_id: int):
         self._paused_until.pop(channel_id, None)
 
     def is_paused(self, channel_id: int) -> bool:
         until = self._paused_until.get(channel_id)
-        if not until:
+        if until is None:
             return False
-        if datetime.now() > until:
+        if time.monotonic() > until:
             del self._paused_until[channel_id]
             return False
         return True
@@ -56,29 +60,68 @@ class SignalBatcher:
     4. Starts exit monitors
     """
 
-    def __init__(self, bridge: DhanBridge, notifier: Notifier):
+    def __init__(self, bridge: DhanBridge, notifier: Notifier, config: Optional[Config] = None):
+        self._cfg = config or Config.from_env()
         self.bridge = bridge
         self.notifier = notifier
         self.tm = bridge.trade_manager
-        self.active_monitors: Set[str] = set()
+        # Symbol -> running exit/retry monitor task (one monitor per symbol)
+        self.active_monitors: Dict[str, asyncio.Task] = {}
         self.channel_state = ChannelState()
-        self.batch_msgs: List[str] = []
-        self.batch_dates: List[datetime] = []
-        self._timer: Optional[asyncio.Task] = None
+        self.batch: Deque[Tuple[str, datetime]] = deque(maxlen=self._cfg.max_batch)
+        self._dropped = 0  # messages evicted from a full batch since the last flush
+        self._wake = asyncio.Event()
+        self._deadline = 0.0
         self._subscribed_sids: Set[str] = set()
+
+        # Dedicated pool for blocking broker calls, isolated from the default executor
+        workers = self._cfg.broker_max_workers
+        self._dhan_pool = ThreadPoolExecutor(workers, thread_name_prefix='dhan')
+        self._dhan_sem = asyncio.Semaphore(workers)
+        # Square-offs get their own threads so slow entries can never delay an exit
+        self._exit_pool = ThreadPoolExecutor(workers, thread_name_prefix='dhan-exit')
+
         self._resume_active_trades()
+        self._flusher = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def run_broker(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking broker call on the dedicated Dhan thread pool."""
+        async with self._dhan_sem:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._dhan_pool, func, *args)
+
+    async def run_exit(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking exit call on the exit pool, bypassing the entry semaphore."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._exit_pool, func, *args)
+
+    def close(self) -> None:
+        """Drop queued entry calls, wait for in-flight calls and exits, save signals.json."""
+        self._dhan_pool.shutdown(wait=True, cancel_futures=True)
+        self._exit_pool.shutdown(wait=True)
+        flush_signals_snapshot()
 
     def _resume_active_trades(self):
         """Resume exit monitors for trades that survived a restart."""
         trades = self.tm.get_all_open_trades()
-        loop = asyncio.get_running_loop()
 
         for t in trades:
             sym = str(t['symbol'])
             sid = str(t['security_id'])
-            logger.info(f'🔄 Resuming Exit Monitor: {sym}')
-            self.active_monitors.add(sym)
-            loop.create_task(self._start_exit_monitor(sym, sid))
+            logger.info('🔄 Resuming Exit Monitor: %s', sym)
+            self._spawn_monitor(sym, self._start_exit_monitor(sym, sid))
+
+    def _spawn_monitor(self, sym: str, coro: Coroutine[Any, Any, None]) -> None:
+        """Start a monitor task and register it for the symbol before it runs."""
+        sym = sys.intern(sym)
+        task = asyncio.get_running_loop().create_task(coro)
+        self.active_monitors[sym] = task
+        task.add_done_callback(lambda t, s=sym: self._release_monitor(s, t))
+
+    def _release_monitor(self, sym: str, task: asyncio.Task) -> None:
+        """Drop a finished monitor unless it was already replaced (retry -> exit)."""
+        if self.active_monitors.get(sym) is task:
+            del self.active_monitors[sym]
 
     def start_manual_monitor(self, pos: Dict[str, Any]):
         """Start monitoring a manually opened position."""
@@ -116,78 +159,126 @@ class SignalBatcher:
         # Add to Trade Manager
         self.tm.add_trade(mock_signal, mock_order, sid)
 
-        logger.info(f'🛡️ Starting Manual Monitor for {sym} (Manual)')
-        self.active_monitors.add(sym)
-        loop = asyncio.get_running_loop()
-        loop.create_task(self._start_exit_monitor(sym, sid))
+        logger.info('🛡️ Starting Manual Monitor for %s (Manual)', sym)
+        self._spawn_monitor(sym, self._start_exit_monitor(sym, sid))
 
     async def add_message(self, text: str, dt: datetime, channel_id: int):
         """Add a message to the batch for processing."""
         if self.channel_state.is_paused(channel_id):
             return
 
-        self.batch_msgs.append(text)
-        self.batch_dates.append(dt)
-
-        if self._timer:
-            self._timer.cancel()
-
+        if len(self.batch) == self.batch.maxlen:
+            # The deque evicts the oldest message; never lose one silently
+            self._dropped += 1
+            if self._dropped == 1:
+                logger.warning('Batch full (%d); dropping oldest messages', self.batch.maxlen)
+        self.batch.append((text, dt))
+
+        # Push the quiet-period deadline out; only wake the flusher to start
+        # a batch or to flush a full one early
+        self._deadline = asyncio.get_running_loop().time() + self._cfg.batch_delay
+        if len(self.batch) == 1 or len(self.batch) >= self._cfg.max_batch_size:
+            self._wake.set()
+
+    async def _flush_loop(self):
+        """Flush the batch once messages go quiet for the batch delay (or it fills up)."""
         loop = asyncio.get_running_loop()
-        self._timer = loop.create_task(self._process_batch())
+        while True:
+            await self._wake.wait()
+
+            # Debounce: sleep until the (moving) deadline actually holds
+            while len(self.batch) < self._cfg.max_batch_size:
+                self._wake.clear()
+                delay = self._deadline - loop.time()
+                if delay <= 0:
+                    break
+                try:
+                    async with asyncio.timeout(delay):
+                        await self._wake.wait()
+                except TimeoutError:
+                    pass
+
+            self._wake.clear()
+            try:
+                await self._process_batch()
+            except Exception as e:
+                logger.error('Batch processing error: %r', e)
+                logger.debug('Batch processing traceback', exc_info=True)
 
     async def _process_batch(self):
-        """Process batched messages after delay."""
-        await asyncio.sleep(BATCH_DELAY_SECONDS)
+        """Parse the pending batch and act on the resulting signals."""
+        # Raw lines are never dropped here: follow-ups like 'SL 80' repeat across
+        # signals and are merged into blocks by the parser. Cross-posted copies
+        # are collapsed after parsing by process_and_save's dedupe index.
+        msgs, dates = zip(*self.batch) if self.batch else ((), ())
+        self.batch.clear()
+        if self._dropped:
+            logger.warning('Dropped %d message(s) from an overflowing batch', self._dropped)
+            self._dropped = 0
 
         try:
-            signals = process_and_save(
-                self.batch_msgs, self.batch_dates, SIGNALS_JSONL, SIGNALS_JSON
+            # Parsing (upper-casing, regex scans) and file IO run off the event loop
+            signals = await asyncio.to_thread(
+                process_and_save,
+                list(msgs),
+                list(dates),
+                self._cfg.signals_jsonl,
+                self._cfg.signals_json,
             )
         except Exception as e:
-            logger.error(f'Parser error: {e}')
+            logger.error('Parser error: %s', e)
             signals = []
 
-        self.batch_msgs.clear()
-        self.batch_dates.clear()
-
-        loop = asyncio.get_running_loop()
-
+        # Pick executable signals (one per symbol, none already monitored)
+        pending: Dict[str, Dict[str, Any]] = {}
         for sig in signals:
             sym = sig.get('trading_symbol', '')
             if not isinstance(sym, str):
                 continue
 
-            if sym in self.active_monitors:
+            # Interned keys let the monitor lookup hit the identity fast path
+            sym = sys.intern(sym)
+            if sym in self.active_monitors or sym in pending:
                 continue
+            pending[sym] = sig
 
-            try:
-                # 1. First Execution Attempt
-                ltp, status = await asyncio.to_thread(self.bridge.execute_super_order, sig)
-
-                # 2. Success Case
-                if status == 'SUCCESS':
-                    await self.notifier.order_placed(sym, 0, ltp)
-                    sid, _, _, _ = self.bridge.mapper.get_security_id(
-                        sym, ltp, self.bridge.get_live_ltp
-                    )
-                    if sid:
-                        self.active_monitors.add(sym)
-                        loop.create_task(self._start_exit_monitor(sym, str(sid)))
-
-                # 3. Retry if price not at trigger yet
-                elif status in ['PRICE_LOW', 'PRICE_HIGH']:
-                    await self.notifier.retrying(sym, status)
-                    logger.info(f'⏳ Price {status} for {sym}. Starting Retry Monitor.')
-                    self.active_monitors.add(sym)
-                    loop.create_task(self._start_retry_monitor(sig))
-
-                elif status == 'ERROR':
-                    await self.notifier.order_failed(sym, 'Execution error')
-                else:
-                    logger.warning(f'Unexpected status: {status}')
+        # 1. First Execution Attempt (concurrent, bounded by the broker pool)
+        results = await asyncio.gather(
+            *(self.run_broker(self.bridge.execute_super_order, sig) for sig in pending.values()),
+            return_exceptions=True,
+        )
 
+        for (sym, sig), result in zip(pending.items(), results):
+            try:
+                if isinstance(result, BaseException):
+                    raise result
+                ltp, status = result
+                await self._handle_execution(sym, sig, ltp, status)
             except Exception as e:
-                logger.warning(f'Error processing signal: {e}')
+                logger.warning('Error processing signal: %s', e)
+
+    async def _handle_execution(self, sym: str, sig: Dict[str, Any], ltp: float, status: str):
+        """Notify and start the follow-up monitor for a first execution attempt."""
+        # 2. Success Case
+        if status == 'SUCCESS':
+            await self.notifier.order_placed(sym, 0, ltp)
+            # Mapper lookup (polars filter + possible LTP HTTP calls) runs off-loop
+            sid, _, _, _ = await self.run_broker(
+                self.bridge.mapper.get_security_id, sym, ltp, self.bridge.get_live_ltp
+            )
+            if sid:
+                self._spawn_monitor(sym, self._start_exit_monitor(sym, str(sid)))
+
+        # 3. Retry if price not at trigger yet
+        elif status in ['PRICE_LOW', 'PRICE_HIGH']:
+            await self.notifier.retrying(sym, status)
+            logger.info('⏳ Price %s for %s. Starting Retry Monitor.', status, sym)
+            self._spawn_monitor(sym, self._start_retry_monitor(sig))
+
+        elif status == 'ERROR':
+            await self.notifier.order_failed(sym, 'Execution error')
+        else:
+            logger.warning('Unexpected status: %s', status)
 
     async def _start_exit_monitor(self, sym: str, sid: str):
         """Create and run an exit monitor for a trade."""
@@ -195,18 +286,18 @@ class SignalBatcher:
             bridge=self.bridge,
             notifier=self.notifier,
             trade_manager=self.tm,
-            active_monitors=self.active_monitors,
             subscribed_sids=self._subscribed_sids,
+            run_broker=self.run_exit,
         )
         await monitor.run(sym, sid)
 
     async def _start_retry_monitor(self, sig: Dict[str, Any]):
         """Create and run a retry monitor for a pending signal."""
         monitor = RetryMonitor(
-            bridge=self.bridge, trade_manager=self.tm, active_monitors=self.active_monitors
+            bridge=self.bridge, trade_manager=self.tm, run_broker=self.run_broker
         )
 
         async def on_success(sym: str, sid: str):
-            asyncio.get_running_loop().create_task(self._start_exit_monitor(sym, sid))
+            self._spawn_monitor(sym, self._start_exit_monitor(sym, sid))
 
         await monitor.run(sig, on_success)
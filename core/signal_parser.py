@@ -12,14 +12,15 @@ Typical message formats:
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import re
 import statistics
 from datetime import date, datetime, time
-from typing import Any, Dict, List, Optional
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -38,6 +39,7 @@ MARKET_OPEN_TIME = time(9, 15)
 DEDUPE_WINDOW_MINUTES = 15
 SIGNALS_JSONL = os.getenv('SIGNALS_JSONL', 'data/signals.jsonl')
 SIGNALS_JSON = os.getenv('SIGNALS_JSON', 'data/signals.json')
+JSON_SNAPSHOT_INTERVAL = int(os.getenv('SIGNALS_JSON_SNAPSHOT_SECONDS', '300'))
 
 # Keywords to ignore - these indicate non-actionable messages
 IGNORE_KEYWORDS = frozenset(
@@ -78,6 +80,9 @@ NOISE_WORDS = frozenset(
 )
 
 # Compiled regex patterns
+# Single-pass noise stripper; longest words first so overlaps resolve like before
+RE_NOISE = re.compile('|'.join(sorted(map(re.escape, NOISE_WORDS), key=len, reverse=True)))
+RE_IGNORE = re.compile('|'.join(map(re.escape, IGNORE_KEYWORDS)))
 RE_POSITIONAL = re.compile(r'\bPOSITION(AL)?|HOLD|LONG\s*TERM\b', re.I)
 # Regex to handle:
 # 1. Optional Action (BUY/SELL) - potentially attached to name (e.g. BUYPOLYCAB)
@@ -97,6 +102,9 @@ RE_TRIGGER = re.compile(r'\b(?:ABOVE|AT|CMP|RANGE)\s+([\d.\-\s]+)', re.I)
 RE_SL = re.compile(r'\b(?:SL|STOP\s*LOSS)\s*[:\-]?\s*([\d.\-\s]+)', re.I)
 RE_TARGET = re.compile(r'\bTARGETS?\s+([\d.\-\s]+)', re.I)
 RE_DIGITS_ONLY = re.compile(r'^[\d.\-\s]+$')
+RE_ACTION = re.compile(r'\b(?:BUY|SELL)\b', re.I)
+
+MONTHS = ('JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC')
 
 
 # =============================================================================
@@ -140,10 +148,7 @@ def to_ist(dt: Any) -> Optional[datetime]:
 
 def remove_noise(text: str) -> str:
     """Remove noise words from text for cleaner parsing."""
-    clean = text.upper()
-    for word in NOISE_WORDS:
-        clean = clean.replace(word, '')
-    return clean.strip()
+    return RE_NOISE.sub('', text.upper()).strip()
 
 
 def parse_price(text: str) -> Optional[float]:
@@ -206,20 +211,7 @@ def detect_underlying(text: str) -> Optional[str]:
         raw_name = match.group(1)
         # Fix: Regex greedily captures month (e.g. VOLTAS FEB -> VOLTASFEB)
         # Remove any month names from the end of the detected name
-        for m in [
-            'JAN',
-            'FEB',
-            'MAR',
-            'APR',
-            'MAY',
-            'JUN',
-            'JUL',
-            'AUG',
-            'SEP',
-            'OCT',
-            'NOV',
-            'DEC',
-        ]:
+        for m in MONTHS:
             if raw_name.endswith(f' {m}'):
                 raw_name = raw_name[: -len(m) - 1]
             elif raw_name.endswith(m):  # merged
@@ -304,7 +296,7 @@ def parse_single_block(text: str, ref_date: Optional[date] = None) -> Dict[str,
         result['ignore'] = True
         return result
 
-    if any(keyword in clean for keyword in IGNORE_KEYWORDS):
+    if RE_IGNORE.search(clean):
         result['ignore'] = True
         return result
 
@@ -361,6 +353,17 @@ def parse_single_block(text: str, ref_date: Optional[date] = None) -> Dict[str,
 # Stream Processing
 # =============================================================================
 
+# Monotonic time of the last signals.json snapshot (first save always writes)
+_last_json_snapshot = float('-inf')
+# signals.json paths whose snapshot is behind the JSONL log
+_stale_snapshots: Dict[str, str] = {}
+
+# JSONL path -> (first line, bytes indexed, signals by key) for incremental dedupe
+_dedupe_index: Dict[str, Tuple[bytes, int, Dict[tuple, Dict[str, Any]]]] = {}
+
+# JSONL encode buffer reused across flushes (batches are flushed one at a time)
+_jsonl_buf = bytearray()
+
 
 def process_and_save(
     messages: List[str],
@@ -399,7 +402,13 @@ def process_and_save(
 
     # Persist new signals
     if new_signals:
-        _save_signals(new_signals, existing, jsonl_path, json_path)
+        try:
+            _save_signals(new_signals, existing, jsonl_path, json_path)
+        except Exception:
+            # _filter_duplicates already indexed these; forget the cached index so
+            # the next call rebuilds it from disk and a retry isn't seen as a dupe
+            _dedupe_index.pop(jsonl_path, None)
+            raise
 
     return new_signals
 
@@ -431,7 +440,7 @@ def _parse_message_batch(messages: List[str], dates: List[datetime]) -> List[Dic
             continue
 
         # Check if this starts a new signal
-        is_new_signal = bool(re.search(r'\b(BUY|SELL)\b', text.upper()) and detect_underlying(text))
+        is_new_signal = bool(RE_ACTION.search(text) and detect_underlying(text))
 
         curr_ts = to_ist(dt)
         last_ts = to_ist(buffer_dates[-1]) if buffer_dates else None
@@ -449,19 +458,38 @@ def _parse_message_batch(messages: List[str], dates: List[datetime]) -> List[Dic
 
 
 def _load_existing_signals(jsonl_path: str) -> Dict[tuple, Dict[str, Any]]:
-    """Load existing signals keyed by (symbol, action)."""
-    existing: Dict[tuple, Dict[str, Any]] = {}
-
-    if os.path.exists(jsonl_path):
-        with open(jsonl_path) as f:
-            for line in f:
-                try:
-                    sig = json.loads(line)
-                    key = (sig['trading_symbol'], sig['action'])
-                    existing[key] = sig
-                except (json.JSONDecodeError, KeyError):
-                    continue
+    """
+    Load existing signals keyed by (symbol, action).
 
+    The index is kept between calls and only lines appended since the last
+    call are decoded. It is rebuilt if the file was replaced or truncated.
+    """
+    try:
+        f = open(jsonl_path, 'rb')
+    except FileNotFoundError:
+        _dedupe_index.pop(jsonl_path, None)
+        return {}
+
+    with f:
+        # First line identifies the file (timestamps make it unique per day)
+        head = f.readline()
+        cached_head, offset, existing = _dedupe_index.get(jsonl_path, (b'', 0, {}))
+        if head != cached_head or os.fstat(f.fileno()).st_size < offset:
+            offset, existing = 0, {}
+
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b'\n'):
+                break  # partially written line; pick it up next time
+            offset += len(line)
+            try:
+                sig = orjson.loads(line)
+                key = (sig['trading_symbol'], sig['action'])
+                existing[key] = sig
+            except (orjson.JSONDecodeError, KeyError, TypeError):
+                continue
+
+    _dedupe_index[jsonl_path] = (head, offset, existing)
     return existing
 
 
@@ -500,14 +528,48 @@ def _save_signals(
     json_path: str,
 ) -> None:
     """Persist signals to disk."""
-    # Append to JSONL
-    with open(jsonl_path, 'a') as f:
-        for sig in new_signals:
-            f.write(json.dumps(sig) + '\n')
-
-    # Overwrite JSON with all signals
-    with open(json_path, 'w') as f:
-        json.dump(list(all_signals.values()), f, indent=2)
+    global _last_json_snapshot
+
+    # Append to JSONL: one pre-encoded buffer, one write
+    buf = _jsonl_buf
+    buf.clear()
+    for sig in new_signals:
+        buf += orjson.dumps(sig, option=orjson.OPT_APPEND_NEWLINE)
+    fd = os.open(jsonl_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        # os.write() may write less than asked; loop so no record is truncated
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(fd, view) :]
+        view.release()
+        # JSONL is the source of truth: make the whole batch durable with one fsync
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    # JSON view is a periodic snapshot; the JSONL log is the source of truth
+    now = monotonic()
+    if now - _last_json_snapshot < JSON_SNAPSHOT_INTERVAL:
+        _stale_snapshots[json_path] = jsonl_path
+        return
+    _last_json_snapshot = now
+    _stale_snapshots.pop(json_path, None)
+    _write_json_snapshot(all_signals, json_path)
+
+
+def _write_json_snapshot(all_signals: Dict[tuple, Dict[str, Any]], json_path: str) -> None:
+    """Atomically replace the signals.json view."""
+    tmp_path = f'{json_path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(list(all_signals.values()), option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, json_path)
+
+
+def flush_signals_snapshot() -> None:
+    """Write any signals.json snapshot still behind the JSONL log (call at shutdown)."""
+    while _stale_snapshots:
+        json_path, jsonl_path = _stale_snapshots.popitem()
+        _write_json_snapshot(_load_existing_signals(jsonl_path), json_path)
 
 
 # =============================================================================
@@ -37,12 +37,26 @@ JWT_EXPIRY_HOURS = 6  # Token expires after 6 hours
 # PnL refresh interval (5 minutes)
 PNL_REFRESH_SECONDS = 300
 
+# Lines replayed on a fresh connection (the feed page keeps at most 500)
+INITIAL_TAIL_LINES = 500
+TAIL_CHUNK_BYTES = 8192
+
 app = FastAPI(title='Live Trade Feed')
 
 # PnL cache
 pnl_cache = {'realized': 0.0, 'unrealized': 0.0, 'total': 0.0, 'updated_at': ''}
 last_pnl_fetch = 0.0
 
+# Keep-alive session for Dhan REST calls
+dhan_session = requests.Session()
+dhan_session.headers.update(
+    {
+        'access-token': DHAN_ACCESS_TOKEN,
+        'client-id': DHAN_CLIENT_ID,
+        'Content-Type': 'application/json',
+    }
+)
+
 
 def create_jwt_token(phone: str) -> str:
     """
@@ -82,13 +96,7 @@ def fetch_pnl() -> dict:
         return pnl_cache
 
     try:
-        headers = {
-            'access-token': DHAN_ACCESS_TOKEN,
-            'client-id': DHAN_CLIENT_ID,
-            'Content-Type': 'application/json',
-        }
-
-        resp = requests.get(f'{DHAN_BASE_URL}/positions', headers=headers, timeout=10)
+        resp = dhan_session.get(f'{DHAN_BASE_URL}/positions', timeout=10)
         # print(f"DEBUG: PnL Fetch Status: {resp.status_code}")
 
         if resp.status_code == 200:
@@ -132,23 +140,75 @@ def load_allowed_phones() -> set[str]:
     return set()
 
 
+def _first_dated_line(f, pos: int) -> tuple[bytes | None, int]:
+    """Return (date, offset) of the first timestamped line starting after `pos`."""
+    f.seek(pos)
+    if pos:
+        f.readline()  # Skip the partial line we landed in
+    while True:
+        start = f.tell()
+        line = f.readline()
+        if not line:
+            return None, start
+        if line[:4].isdigit() and line[4:5] == b'-':
+            return line[:10], start
+
+
 def find_today_start() -> int:
+    """
+    Find the byte offset of today's first log line.
+
+    Log lines are written in time order, so this bisects on file offsets and
+    reads only a handful of lines instead of scanning the whole log.
+    """
     if not LOG_FILE.exists():
         return 0
 
-    today = datetime.now().strftime('%Y-%m-%d')
-    position = 0
+    today = datetime.now().strftime('%Y-%m-%d').encode()
 
     with open(LOG_FILE, 'rb') as f:
-        while True:
-            line = f.readline()
-            if not line:
-                break
-            if today.encode() in line[:25]:
-                return position
-            position = f.tell()
+        lo, hi = 0, os.fstat(f.fileno()).st_size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            date, _ = _first_dated_line(f, mid)
+            if date is None or date >= today:
+                hi = mid
+            else:
+                lo = mid + 1
+        return _first_dated_line(f, lo)[1]
+
+
+def find_tail_start(max_lines: int = INITIAL_TAIL_LINES) -> int:
+    """
+    Find the byte offset where the last `max_lines` log lines begin.
 
-    return position
+    Reads backwards from the end of the log in small chunks, so the cost
+    depends on the number of lines wanted, not the size of the file.
+    """
+    if not LOG_FILE.exists():
+        return 0
+
+    with open(LOG_FILE, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        pos = size
+        newlines = 0
+        while pos > 0:
+            step = min(TAIL_CHUNK_BYTES, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            # A trailing newline ends the last line; it doesn't start a new one
+            if pos + step == size and chunk.endswith(b'\n'):
+                chunk = chunk[:-1]
+            found = chunk.count(b'\n')
+            if newlines + found >= max_lines:
+                # The line break just before the oldest wanted line is in this chunk
+                idx = len(chunk)
+                for _ in range(max_lines - newlines):
+                    idx = chunk.rindex(b'\n', 0, idx)
+                return pos + idx + 1
+            newlines += found
+        return 0
 
 
 @app.get('/', response_class=HTMLResponse)
@@ -214,12 +274,12 @@ async def websocket_endpoint(websocket: WebSocket):
             except ValueError:
                 pass
 
-    # Use client position if valid, otherwise start from today
-    today_start = find_today_start()
+    # Use client position if valid, otherwise replay the tail of today's log
+    today_start = await asyncio.to_thread(find_today_start)
     if client_pos > today_start and LOG_FILE.exists() and client_pos <= LOG_FILE.stat().st_size:
         last_position = client_pos
     else:
-        last_position = today_start
+        last_position = max(today_start, await asyncio.to_thread(find_tail_start))
 
     pnl_counter = 0
 
@@ -9,15 +9,24 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import re
 import signal
 import sys
-from logging.handlers import RotatingFileHandler
 
 from dotenv import load_dotenv
 from telethon import TelegramClient, events
+from telethon.crypto import aes as telethon_aes
+from telethon.utils import get_peer_id
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - falls back to the stock asyncio loop
+    uvloop = None
 
 try:
     from core.dhan_bridge import DhanBridge
+    from core.entity_cache import EntityCache
+    from core.logging_setup import log_flush_loop, setup_logging
     from core.notifier import Notifier
     from core.signal_batcher import SignalBatcher
 except ImportError as e:
@@ -30,6 +39,7 @@ load_dotenv()
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
 MAX_LOG_SIZE = int(os.getenv('MAX_LOG_SIZE_MB', '50')) * 1024 * 1024
 LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', '5'))
+LOG_FLUSH_SECONDS = float(os.getenv('LOG_FLUSH_SECONDS', '1'))
 
 TELEGRAM_API_ID = os.getenv('TELEGRAM_API_ID')
 TELEGRAM_API_HASH = os.getenv('TELEGRAM_API_HASH')
@@ -44,43 +54,16 @@ TARGET_CHANNEL_ID = os.getenv('TARGET_CHANNEL_ID', '')
 if TARGET_CHANNEL_ID:
     TARGET_CHANNELS.append(int(TARGET_CHANNEL_ID))
 
-os.makedirs('logs', exist_ok=True)
-os.makedirs('data', exist_ok=True)
-
-
-# --- LOGGING --- #
-def setup_logging():
-    formatter = logging.Formatter(
-        '%(asctime)s [%(levelname)s] [%(name)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S'
-    )
-
-    file_handler = RotatingFileHandler(
-        'logs/trade.log', maxBytes=MAX_LOG_SIZE, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
-    )
-    file_handler.setFormatter(formatter)
-
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
+RESOLVE_CONCURRENCY = 4  # parallel get_entity() calls at startup
+CHANNEL_ID_RE = re.compile(r'-?\d+')
 
-    root = logging.getLogger()
-    root.handlers.clear()
-    root.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
-    root.addHandler(file_handler)
-    root.addHandler(console_handler)
-
-
-setup_logging()
 logger = logging.getLogger('Main')
 
 
 # --- SIGNAL HANDLING --- #
-def handle_shutdown_signal(signum, frame):
-    logger.info(f'Received signal {signum}. Shutting down.')
-    sys.exit(0)
-
-
-signal.signal(signal.SIGTERM, handle_shutdown_signal)
-signal.signal(signal.SIGINT, handle_shutdown_signal)
+def _on_shutdown_signal(signum: int, stop_event: asyncio.Event):
+    logger.info('Received signal %s. Shutting down.', signum)
+    stop_event.set()
 
 
 # --- RECONCILIATION --- #
@@ -91,24 +74,51 @@ async def reconciliation_loop(bridge: DhanBridge, batcher: SignalBatcher, interv
     while True:
         try:
             # Reconcile and get new manual positions
-            new_positions = await asyncio.to_thread(bridge.reconcile_positions)
+            new_positions = await batcher.run_broker(bridge.reconcile_positions)
 
             # Start monitoring new manual positions
             for pos in new_positions:
                 batcher.start_manual_monitor(pos)
 
         except Exception as e:
-            logger.error(f'Reconciliation loop error: {e}', exc_info=True)
+            logger.error('Reconciliation loop error: %s', e, exc_info=True)
 
         await asyncio.sleep(interval)
 
 
+# --- CHANNEL RESOLUTION --- #
+async def resolve_channel(
+    client: TelegramClient, entity_cache: EntityCache, ch, limit: asyncio.Semaphore
+):
+    """Resolves a target channel, preferring the on-disk entity cache."""
+    # Cached peers need no round-trip to Telegram
+    cached = entity_cache.get(ch)
+    if cached is not None:
+        return cached
+
+    # If channel is a string but looks like an ID, convert it
+    if isinstance(ch, str) and CHANNEL_ID_RE.fullmatch(ch):
+        ch = int(ch)
+
+    # Bound concurrent lookups to stay clear of Telegram flood limits
+    async with limit:
+        entity = await client.get_entity(ch)
+    entity_cache.put(ch, entity)
+    return entity
+
+
 # --- MAIN --- #
 async def main():
     if not TELEGRAM_API_ID or not TELEGRAM_API_HASH:
         logger.critical('Telegram credentials missing')
         return
 
+    # Telethon reports its AES backend at import, before logging is configured
+    if telethon_aes.cryptg is None:
+        logger.warning('cryptg not installed; Telethon will decrypt updates without it (slower)')
+
+    os.makedirs('data', exist_ok=True)
+
     client = TelegramClient(SESSION_NAME, int(TELEGRAM_API_ID), TELEGRAM_API_HASH)
     await client.start()  # pyright: ignore[reportGeneralTypeIssues]
     logger.info('Telegram connected')
@@ -120,29 +130,80 @@ async def main():
     await notifier.started_bot()
 
     asyncio.create_task(reconciliation_loop(bridge, batcher, 300))  # Every 5 minutes
+    asyncio.create_task(log_flush_loop(LOG_FLUSH_SECONDS))
 
-    resolved = []
-    for ch in TARGET_CHANNELS:
-        try:
-            # If channel is a string but looks like an ID, convert it
-            if isinstance(ch, str) and ch.lstrip('-').isdigit():
-                ch = int(ch)
+    entity_cache = EntityCache()
+    resolve_limit = asyncio.Semaphore(RESOLVE_CONCURRENCY)
+    results = await asyncio.gather(
+        *(resolve_channel(client, entity_cache, ch, resolve_limit) for ch in TARGET_CHANNELS),
+        return_exceptions=True,
+    )
 
-            resolved.append(await client.get_entity(ch))
-        except (ValueError, TypeError) as e:
-            logger.error(f'Invalid channel ID {ch}: {e}')
-        except Exception as e:
+    resolved = []
+    for ch, result in zip(TARGET_CHANNELS, results):
+        if isinstance(result, (ValueError, TypeError)):
+            logger.error('Invalid channel ID %s: %s', ch, result)
+        elif isinstance(result, BaseException):
             # Catch-all for Telethon resolution errors
-            logger.error(f'Failed to resolve channel {ch}: {e}')
+            logger.error('Failed to resolve channel %s: %s', ch, result)
+        else:
+            resolved.append(result)
+
+    entity_cache.save()
 
-    @client.on(events.NewMessage(chats=resolved))
+    # Filter on marked peer IDs so Telethon never re-resolves the targets.
+    # Must stay a list/set: Telethon's is_list_like() rejects frozenset.
+    resolved_ids = list({get_peer_id(entity) for entity in resolved})
+    if not resolved_ids:
+        logger.warning('No target channels resolved; no signals will be received')
+
+    @client.on(events.NewMessage(chats=resolved_ids))
     async def handler(event):
-        if event.message and event.message.message:
-            await batcher.add_message(event.message.message, event.message.date, event.chat_id)
+        text = event.message.message if event.message else None
+        # Media without caption / blank text never parses; keep it out of the batch
+        if not text or text.isspace():
+            return
+        await batcher.add_message(text, event.message.date, event.chat_id)
+
+    # Installed only now: during login and startup, Ctrl-C/SIGTERM keep their
+    # default behaviour and abort immediately. From here on they only set the
+    # stop event, and teardown happens in shutdown() on the loop.
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, _on_shutdown_signal, signum, stop_event)
+
+    # Run until Telegram disconnects or a shutdown signal arrives
+    disconnected = asyncio.ensure_future(client.run_until_disconnected())
+    stopped = asyncio.ensure_future(stop_event.wait())
+    await asyncio.wait({disconnected, stopped}, return_when=asyncio.FIRST_COMPLETED)
+
+    # Deliver queued admin alerts while the client is still connected
+    await notifier.flush()
+    await shutdown(client, batcher)
 
-    # pyright: ignore[reportGeneralTypeIssues]
-    await client.run_until_disconnected()
+
+async def shutdown(client: TelegramClient, batcher: SignalBatcher):
+    """Disconnect Telegram, cancel all remaining tasks, then drain the broker pool."""
+    await client.disconnect()
+
+    tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    for t in tasks:
+        t.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Let in-flight orders/exits reach the broker before the process exits
+    await asyncio.to_thread(batcher.close)
+    logger.info('Shutdown complete (%d tasks cancelled)', len(tasks))
 
 
 if __name__ == '__main__':
+    setup_logging(
+        level=LOG_LEVEL,
+        max_bytes=MAX_LOG_SIZE,
+        backup_count=LOG_BACKUP_COUNT,
+        flush_seconds=LOG_FLUSH_SECONDS,
+    )
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
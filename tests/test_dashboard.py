@@ -0,0 +1,54 @@
+import pytest
+
+pytest.importorskip('jwt')
+pytest.importorskip('fastapi')
+
+import dashboard  # noqa: E402
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    """Point the dashboard at a temporary log file."""
+    path = tmp_path / 'trade.log'
+    monkeypatch.setattr(dashboard, 'LOG_FILE', path)
+    return path
+
+
+class TestFindTodayStart:
+    def test_skips_previous_days(self, log_file, monkeypatch):
+        """Test that the bisect lands on the first line dated today."""
+        lines = [f'2026-01-04 10:00:{i:02d} | INFO | old {i}\n' for i in range(50)]
+        lines.append('    continuation of a traceback\n')
+        lines += [f'2026-01-05 09:15:{i:02d} | INFO | new {i}\n' for i in range(50)]
+        log_file.write_text(''.join(lines))
+
+        class FixedDatetime(dashboard.datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls(2026, 1, 5, 12, 0)
+
+        monkeypatch.setattr(dashboard, 'datetime', FixedDatetime)
+        offset = dashboard.find_today_start()
+
+        assert log_file.read_bytes()[offset:].startswith(b'2026-01-05 09:15:00')
+
+    def test_missing_file(self, log_file):
+        """Test that a missing log starts at offset 0."""
+        assert dashboard.find_today_start() == 0
+
+
+class TestFindTailStart:
+    def test_returns_last_lines(self, log_file, monkeypatch):
+        """Test that the offset starts exactly max_lines from the end, across chunks."""
+        monkeypatch.setattr(dashboard, 'TAIL_CHUNK_BYTES', 64)
+        lines = [f'line {i}\n' for i in range(200)]
+        log_file.write_text(''.join(lines))
+
+        offset = dashboard.find_tail_start(max_lines=25)
+
+        assert log_file.read_text()[offset:] == ''.join(lines[-25:])
+
+    def test_short_file(self, log_file):
+        """Test that a log shorter than max_lines is read from the start."""
+        log_file.write_text('a\nb\nc\n')
+        assert dashboard.find_tail_start(max_lines=10) == 0
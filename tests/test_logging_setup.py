@@ -0,0 +1,33 @@
+import logging
+
+from core.logging_setup import FastRotatingFileHandler
+
+
+class TestFastRotatingFileHandler:
+    def test_rotates_at_max_bytes(self, tmp_path):
+        """Test that the in-memory size tracking still rotates before maxBytes."""
+        path = tmp_path / 'trade.log'
+        handler = FastRotatingFileHandler(str(path), maxBytes=16 * 1024, backupCount=3)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+
+        for i in range(500):
+            record = logging.LogRecord(
+                'T', logging.INFO, __file__, 0, f'{i:04d} ' + 'x' * 90, None, None
+            )
+            handler.handle(record)
+        handler.sync()
+        handler.close()
+
+        files = sorted(tmp_path.glob('trade.log*'))
+        assert len(files) > 1
+        assert all(f.stat().st_size <= 16 * 1024 for f in files)
+        # Nothing lost or duplicated in the live file's tail
+        assert path.read_text().splitlines()[-1].startswith('0499 ')
+
+    def test_resumes_size_of_existing_file(self, tmp_path):
+        """Test that a reopened log keeps counting from its current size."""
+        path = tmp_path / 'trade.log'
+        path.write_text('y' * 1000)
+        handler = FastRotatingFileHandler(str(path), maxBytes=4096)
+        assert handler._size == 1000
+        handler.close()
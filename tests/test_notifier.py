@@ -0,0 +1,17 @@
+from core.notifier import Notifier
+
+
+class TestNotifierPack:
+    def test_coalesces_within_limit(self):
+        """Test that short messages are joined into one text."""
+        notifier = Notifier(client=None, chat_id=1)
+        assert list(notifier._pack(['a', 'b', 'c'])) == ['a\n---\nb\n---\nc']
+
+    def test_splits_at_message_limit(self):
+        """Test that batches are split so no text exceeds Telegram's limit."""
+        notifier = Notifier(client=None, chat_id=1)
+        messages = ['x' * 3000, 'y' * 3000, 'z' * 10]
+        texts = list(notifier._pack(messages))
+
+        assert texts == ['x' * 3000, 'y' * 3000 + '\n---\n' + 'z' * 10]
+        assert all(len(t) <= Notifier.MAX_MESSAGE_LEN for t in texts)
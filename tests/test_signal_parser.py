@@ -1,8 +1,16 @@
 from datetime import datetime
 
+import orjson
 import pytest
 
-from core.signal_parser import parse_single_block, process_and_save
+import core.signal_parser as signal_parser
+from core.signal_parser import (
+    _dedupe_index,
+    _load_existing_signals,
+    flush_signals_snapshot,
+    parse_single_block,
+    process_and_save,
+)
 
 
 class TestSignalParser:
@@ -65,3 +73,92 @@ class TestSignalParser:
         msg = 'SAFE TRADERS BOOK PROFIT'
         signals = process_and_save([msg], [dynamic_dates['today']])
         assert len(signals) == 0  # Should be filtered out
+
+
+def _signal_line(symbol: str, ts: str = '2026-01-05T10:00:00+05:30') -> bytes:
+    return orjson.dumps({'trading_symbol': symbol, 'action': 'BUY', 'timestamp': ts}) + b'\n'
+
+
+class TestDedupeIndex:
+    def test_reads_only_appended_lines(self, tmp_path):
+        """Test that a second load decodes just the lines appended since the first."""
+        path = tmp_path / 'signals.jsonl'
+        path.write_bytes(_signal_line('NIFTY 24000 CE'))
+
+        existing = _load_existing_signals(str(path))
+        assert set(existing) == {('NIFTY 24000 CE', 'BUY')}
+        offset = _dedupe_index[str(path)][1]
+
+        with open(path, 'ab') as f:
+            f.write(_signal_line('BANKNIFTY 52000 PE'))
+
+        existing = _load_existing_signals(str(path))
+        assert set(existing) == {('NIFTY 24000 CE', 'BUY'), ('BANKNIFTY 52000 PE', 'BUY')}
+        assert _dedupe_index[str(path)][1] == path.stat().st_size > offset
+
+    def test_partial_line_waits_for_newline(self, tmp_path):
+        """Test that a half-written trailing line is picked up once completed."""
+        path = tmp_path / 'signals.jsonl'
+        line = _signal_line('SENSEX 80000 CE')
+        path.write_bytes(_signal_line('NIFTY 24000 CE') + line[:10])
+
+        existing = _load_existing_signals(str(path))
+        assert ('SENSEX 80000 CE', 'BUY') not in existing
+
+        with open(path, 'ab') as f:
+            f.write(line[10:])
+
+        existing = _load_existing_signals(str(path))
+        assert ('SENSEX 80000 CE', 'BUY') in existing
+
+    def test_rebuilds_when_file_replaced(self, tmp_path):
+        """Test that a replaced or truncated file drops the stale index."""
+        path = tmp_path / 'signals.jsonl'
+        path.write_bytes(_signal_line('NIFTY 24000 CE') + _signal_line('BHEL 255 PE'))
+        assert len(_load_existing_signals(str(path))) == 2
+
+        # New day: different first line
+        path.write_bytes(_signal_line('NIFTY 24000 CE', '2026-01-06T09:30:00+05:30'))
+        existing = _load_existing_signals(str(path))
+        assert set(existing) == {('NIFTY 24000 CE', 'BUY')}
+
+        # Truncated back to an empty file
+        path.write_bytes(b'')
+        assert _load_existing_signals(str(path)) == {}
+
+        path.unlink()
+        assert _load_existing_signals(str(path)) == {}
+        assert str(path) not in _dedupe_index
+
+    def test_failed_save_does_not_mark_duplicate(self, tmp_path, monkeypatch):
+        """Test that a signal whose append failed is accepted again on retry."""
+        jsonl, json_path = str(tmp_path / 's.jsonl'), str(tmp_path / 's.json')
+        msg = ['BUY NIFTY 24000 CE ABOVE 120']
+        when = [datetime(2026, 1, 5, 10, 0, tzinfo=signal_parser.IST)]
+
+        def fail_write(fd, data):
+            raise OSError('disk full')
+
+        monkeypatch.setattr(signal_parser.os, 'write', fail_write)
+        with pytest.raises(OSError):
+            process_and_save(msg, when, jsonl, json_path)
+        monkeypatch.undo()
+
+        assert len(process_and_save(msg, when, jsonl, json_path)) == 1
+
+
+class TestSignalsSnapshot:
+    def test_shutdown_flush_writes_pending_snapshot(self, tmp_path, monkeypatch):
+        """Test that signals saved between periodic snapshots reach signals.json on flush."""
+        jsonl, json_path = str(tmp_path / 's.jsonl'), str(tmp_path / 's.json')
+        monkeypatch.setattr(signal_parser, 'JSON_SNAPSHOT_INTERVAL', 3600)
+        monkeypatch.setattr(signal_parser, '_last_json_snapshot', float('-inf'))
+
+        # Fixed in-market time: the parser drops signals before 09:15 IST
+        when = [datetime(2026, 1, 5, 10, 0, tzinfo=signal_parser.IST)]
+        process_and_save(['BUY NIFTY 24000 CE ABOVE 120'], when, jsonl, json_path)
+        process_and_save(['BUY BANKNIFTY 52000 PE ABOVE 300'], when, jsonl, json_path)
+        assert len(orjson.loads(open(json_path, 'rb').read())) == 1
+
+        flush_signals_snapshot()
+        assert len(orjson.loads(open(json_path, 'rb').read())) == 2
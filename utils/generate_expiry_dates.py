@@ -71,7 +71,8 @@ def select_expiry_date(underlying: str, reference_dt: Optional[datetime] = None)
         elif KOLKATA:
             now = now.astimezone(KOLKATA)
 
-    today = datetime.now(KOLKATA).date()
+    # Single clock snapshot: every rule below works off this date
+    today = now.date()
     u = underlying.strip().upper()
 
     calculated_date = today  # Default